@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-sdk>=0.7.0"]
+# dependencies = ["iscc-sdk>=0.7.0", "orjson>=3.9"]
 # ///
 """
 ISCC Batch Processor
@@ -12,134 +12,124 @@ Supports parallel processing, progress reporting, and multiple output formats.
 
 import argparse
 import csv
-import json
+import os
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import iscc_sdk as idk
+import iscc_utils
 
 # Common media file extensions
-MEDIA_EXTENSIONS = {
-    ".txt",
-    ".md",
-    ".pdf",
-    ".doc",
-    ".docx",
-    ".odt",
-    ".rtf",
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".gif",
-    ".bmp",
-    ".tiff",
-    ".webp",
-    ".svg",
-    ".mp3",
-    ".wav",
-    ".flac",
-    ".ogg",
-    ".m4a",
-    ".aac",
-    ".mp4",
-    ".avi",
-    ".mkv",
-    ".mov",
-    ".wmv",
-    ".flv",
-    ".webm",
-    ".html",
-    ".xml",
-    ".json",
-    ".csv",
-    ".epub",
-    ".mobi",
-}
+MEDIA_EXTENSIONS = frozenset(
+    {
+        ".txt",
+        ".md",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".odt",
+        ".rtf",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".tiff",
+        ".webp",
+        ".svg",
+        ".mp3",
+        ".wav",
+        ".flac",
+        ".ogg",
+        ".m4a",
+        ".aac",
+        ".mp4",
+        ".avi",
+        ".mkv",
+        ".mov",
+        ".wmv",
+        ".flv",
+        ".webm",
+        ".html",
+        ".xml",
+        ".json",
+        ".csv",
+        ".epub",
+        ".mobi",
+    }
+)
 
 
 def is_media_file(file_path):
-    # type: (Path) -> bool
+    # type: (str | Path) -> bool
     """
     Check if file is a supported media file.
 
     Args:
-        file_path: Path to check
+        file_path: Path or file name to check
 
     Returns:
         True if file extension is supported
     """
-    return file_path.suffix.lower() in MEDIA_EXTENSIONS
+    ext = os.path.splitext(file_path)[1]
+    return ext in MEDIA_EXTENSIONS or ext.lower() in MEDIA_EXTENSIONS
 
 
-def has_sidecar(file_path):
-    # type: (Path) -> bool
-    """
-    Check if file has .iscc.json sidecar (already processed).
-
-    Args:
-        file_path: Path to media file
+# Minimum seconds between progress line redraws
+PROGRESS_INTERVAL = 0.2
 
-    Returns:
-        True if sidecar exists
-    """
-    sidecar_path = file_path.with_suffix(file_path.suffix + ".iscc.json")
-    return sidecar_path.exists()
+# Suffix of sidecar files marking already processed media files
+SIDECAR_SUFFIX = ".iscc.json"
 
 
 def find_media_files(directory, recursive):
-    # type: (Path, bool) -> Iterator[Path]
+    # type: (Path, bool) -> Iterator[tuple[Path, bool]]
     """
     Find all media files in directory.
 
+    Each directory is listed once with os.scandir; file types come from the cached
+    directory entries and sidecars are looked up in the same listing.
+
     Args:
         directory: Directory to search
         recursive: Search subdirectories
 
     Yields:
-        Path objects for media files
+        Tuples of media file path and whether it has a .iscc.json sidecar
     """
-    if recursive:
-        pattern = "**/*"
-    else:
-        pattern = "*"
+    with os.scandir(directory) as it:
+        entries = list(it)
 
-    for path in directory.glob(pattern):
-        if path.is_file() and is_media_file(path):
-            yield path
+    sidecars = {e.name for e in entries if e.name.endswith(SIDECAR_SUFFIX)}
+    for entry in entries:
+        if is_media_file(entry.name) and entry.is_file():
+            yield Path(entry.path), entry.name + SIDECAR_SUFFIX in sidecars
 
+    if recursive:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_media_files(Path(entry.path), recursive)
 
-def process_file(file_path, force):
-    # type: (Path, bool) -> Optional[dict]
+
+def process_file(file_path):
+    # type: (Path) -> dict
     """
     Process single file and generate ISCC.
 
     Args:
         file_path: Path to file
-        force: Process even if sidecar exists
 
     Returns:
-        Dictionary with file path and ISCC metadata, or None if skipped
+        Dictionary with file path and ISCC metadata or error message
     """
-    # Skip if already processed (unless force)
-    if not force and has_sidecar(file_path):
-        return None
-
     try:
         # Generate ISCC
         iscc_meta = idk.code_iscc(str(file_path))
 
-        # Convert to dict
-        if hasattr(iscc_meta, "dict"):
-            meta_dict = iscc_meta.dict()
-        elif hasattr(iscc_meta, "model_dump"):
-            meta_dict = iscc_meta.model_dump()
-        else:
-            meta_dict = dict(iscc_meta)
-
         # Add file path
-        result = {"file": str(file_path.resolve()), "iscc": meta_dict}
+        result = {"file": str(file_path.resolve()), "iscc": iscc_utils.to_dict(iscc_meta)}
 
         return result
 
@@ -148,8 +138,8 @@ def process_file(file_path, force):
         return {"file": str(file_path.resolve()), "error": str(e)}
 
 
-def batch_process(directory, recursive, force, workers):
-    # type: (Path, bool, bool, int) -> list[dict]
+def batch_process(directory, recursive, force, workers, on_result=None):
+    # type: (Path, bool, bool, int, Optional[Callable[[dict], None]]) -> list[dict]
     """
     Process all media files in directory.
 
@@ -158,13 +148,20 @@ def batch_process(directory, recursive, force, workers):
         recursive: Search subdirectories
         force: Process even if already processed
         workers: Number of parallel workers
+        on_result: Handle each result as soon as it is available instead of collecting it
 
     Returns:
-        List of results
+        List of results (empty if handled by on_result)
     """
-    # Find all media files
-    files = list(find_media_files(directory, recursive))
-    total = len(files)
+    # Find all media files, skipping already processed ones (unless force)
+    files = []
+    skipped = 0
+    for file_path, sidecar in find_media_files(directory, recursive):
+        if sidecar and not force:
+            skipped += 1
+        else:
+            files.append(file_path)
+    total = len(files) + skipped
 
     if total == 0:
         print("No media files found", file=sys.stderr)
@@ -175,31 +172,33 @@ def batch_process(directory, recursive, force, workers):
 
     results = []
     processed = 0
-    skipped = 0
     errors = 0
-
-    # Process files in parallel
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        # Submit all tasks
-        future_to_file = {executor.submit(process_file, f, force): f for f in files}
-
-        # Collect results as they complete
-        for future in as_completed(future_to_file):
-            result = future.result()
-
-            if result is None:
-                skipped += 1
-            elif "error" in result:
+    write_progress = sys.stderr.write
+    last_progress = 0.0
+
+    # Process files in parallel worker processes, handing out several files per task
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Collect results in input order
+        for result in executor.map(process_file, files, chunksize=chunksize):
+            if "error" in result:
                 errors += 1
-                results.append(result)
             else:
                 processed += 1
+
+            if on_result is None:
                 results.append(result)
+            else:
+                on_result(result)
 
-            # Progress update
+            # Progress update (rate limited, the final count is always shown)
             done = processed + skipped + errors
-            msg = f"\rProgress: {done}/{total} ({processed} ok, {skipped} skip, {errors} err)"
-            print(msg, file=sys.stderr, end="")
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL or done == total:
+                last_progress = now
+                write_progress(
+                    f"\rProgress: {done}/{total} ({processed} ok, {skipped} skip, {errors} err)"
+                )
 
     elapsed = time.time() - start_time
     print(f"\n\nCompleted in {elapsed:.2f}s", file=sys.stderr)
@@ -219,9 +218,7 @@ def format_json(results, pretty):
     Returns:
         JSON string
     """
-    if pretty:
-        return json.dumps(results, indent=2, ensure_ascii=False)
-    return json.dumps(results, separators=(",", ":"), ensure_ascii=False)
+    return iscc_utils.format_output(results, pretty)
 
 
 def format_jsonl(results):
@@ -235,42 +232,69 @@ def format_jsonl(results):
     Returns:
         JSON Lines string (one JSON object per line)
     """
-    lines = [json.dumps(r, separators=(",", ":"), ensure_ascii=False) for r in results]
+    lines = [iscc_utils.format_output(r) for r in results]
     return "\n".join(lines)
 
 
-def format_csv(results):
-    # type: (list[dict]) -> str
+# Columns of CSV output
+CSV_HEADER = ["file", "iscc", "error"]
+
+
+def csv_row(result):
+    # type: (dict) -> list[str]
     """
-    Format results as CSV.
+    Convert a result to a CSV row.
 
     Args:
-        results: List of result dictionaries
+        result: Result dictionary
 
     Returns:
-        CSV string
+        Row values for CSV_HEADER columns
     """
-    import io  # Local import for rarely-used CSV formatting
+    get = result.get
+    error = get("error") or ""
+    if error:
+        return [get("file") or "", "", error]
 
-    output = io.StringIO()
-    writer = csv.writer(output)
+    # No default dict per row; a missing or empty "iscc" entry yields an empty code
+    iscc_meta = get("iscc")
+    iscc_code = iscc_meta.get("iscc") or "" if iscc_meta else ""
+    return [get("file") or "", iscc_code, ""]
+
+
+def write_csv(results, out):
+    # type: (Iterable[dict], TextIO) -> None
+    """
+    Write results as CSV directly to a text stream.
+
+    Args:
+        results: Result dictionaries
+        out: Text stream to write to
+    """
+    writer = csv.writer(out)
 
     # Header
-    writer.writerow(["file", "iscc", "error"])
+    writer.writerow(CSV_HEADER)
 
     # Rows
-    for result in results:
-        file_path = result.get("file", "")
-        error = result.get("error", "")
+    writer.writerows(csv_row(result) for result in results)
 
-        if error:
-            iscc_code = ""
-        else:
-            iscc_meta = result.get("iscc", {})
-            iscc_code = iscc_meta.get("iscc", "")
 
-        writer.writerow([file_path, iscc_code, error])
+def format_csv(results):
+    # type: (list[dict]) -> str
+    """
+    Format results as CSV.
 
+    Args:
+        results: List of result dictionaries
+
+    Returns:
+        CSV string
+    """
+    import io  # Local import for rarely-used CSV formatting
+
+    output = io.StringIO()
+    write_csv(results, output)
     return output.getvalue()
 
 
@@ -297,6 +321,40 @@ def format_output(results, output_format, pretty):
         raise ValueError(f"Unknown format: {output_format}")
 
 
+def result_writer(output_format, out):
+    # type: (str, TextIO) -> Callable[[dict], None]
+    """
+    Create a callback that writes each result to a stream as soon as it is available.
+
+    Args:
+        output_format: Streaming output format (jsonl, csv)
+        out: Text stream to write to
+
+    Returns:
+        Function writing one result record
+    """
+    if output_format == "jsonl":
+
+        def write(result):
+            # type: (dict) -> None
+            out.write(iscc_utils.format_output(result) + "\n")
+            out.flush()
+
+    elif output_format == "csv":
+        writer = csv.writer(out)
+        writer.writerow(CSV_HEADER)
+
+        def write(result):
+            # type: (dict) -> None
+            writer.writerow(csv_row(result))
+            out.flush()
+
+    else:
+        raise ValueError(f"Format cannot be streamed: {output_format}")
+
+    return write
+
+
 def main():
     # type: () -> int
     """Main entry point."""
@@ -351,6 +409,20 @@ Examples:
         return 2
 
     try:
+        # JSON Lines and CSV records are written as soon as each result is available
+        if args.format in ("jsonl", "csv"):
+            if args.output:
+                with args.output.open("w", encoding="utf-8", newline="") as out:
+                    on_result = result_writer(args.format, out)
+                    batch_process(
+                        args.directory, args.recursive, args.force, args.workers, on_result
+                    )
+                print(f"Results written to {args.output}", file=sys.stderr)
+            else:
+                on_result = result_writer(args.format, sys.stdout)
+                batch_process(args.directory, args.recursive, args.force, args.workers, on_result)
+            return 0
+
         # Process files
         results = batch_process(args.directory, args.recursive, args.force, args.workers)
 
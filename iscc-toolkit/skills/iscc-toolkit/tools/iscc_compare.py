@@ -9,8 +9,10 @@ with per-unit-type breakdown. Output schema is aligned with search.iscc.id API.
 """
 
 import argparse
+import functools
 import json
 import sys
+from pathlib import Path
 
 try:
     import iscc_core as ic
@@ -22,15 +24,76 @@ except ImportError:  # pragma: no cover
     sys.exit(1)
 
 
-# Maintype names for output
-MAINTYPE_NAMES = {
-    ic.MT.META: "meta",
-    ic.MT.SEMANTIC: "semantic",
-    ic.MT.CONTENT: "content",
-    ic.MT.DATA: "data",
-    ic.MT.INSTANCE: "instance",
-    ic.MT.ID: "id",
-}
+# Maintype names for output, indexed by maintype value (MT values are contiguous from 0).
+# Interned so all result dicts share the same key objects.
+MAINTYPE_NAMES = tuple(sys.intern(mt.name.lower()) for mt in sorted(ic.MT))
+
+
+@functools.lru_cache(maxsize=100_000)
+def decompose_units(iscc_code):
+    # type: (str) -> tuple[tuple[int, int, bytes], ...]
+    """
+    Decompose an ISCC into unit headers and digests (memoized for repeated codes).
+
+    The header key packs maintype, subtype and version into one int so that
+    compatible units are matched by a single int comparison.
+
+    :param iscc_code: ISCC code
+    :return: Tuple of (header key, maintype, digest) tuples
+    """
+    units = []
+    for unit in ic.iscc_decompose(iscc_code):
+        mtype, stype, version, _, digest = ic.decode_header(ic.decode_base32(unit))
+        units.append(((mtype << 16) | (stype << 8) | version, int(mtype), digest))
+    return tuple(units)
+
+
+def prefix_hamming(a, b):
+    # type: (bytes, bytes) -> tuple[int, int]
+    """
+    Count differing bits within the common prefix of two byte strings.
+
+    :param a: First byte string
+    :param b: Second byte string
+    :return: Tuple of hamming distance and common prefix length in bits
+    """
+    common_bytes = min(len(a), len(b))
+    ia = int.from_bytes(a[:common_bytes], "big")
+    ib = int.from_bytes(b[:common_bytes], "big")
+    return (ia ^ ib).bit_count(), common_bytes * 8
+
+
+def compare_identical(iscc_code):
+    # type: (str) -> dict | None
+    """
+    Compare an ISCC with itself without pairing and hashing its units.
+
+    :param iscc_code: ISCC code
+    :return: Comparison result (see compare_iscc), or None if the code has several units
+        with the same header and needs the full pairwise comparison
+    """
+    units = decompose_units(iscc_code)
+    if len({key for key, _, _ in units}) != len(units):
+        return None
+
+    types = {}
+    for _, mtype, digest in units:
+        if mtype in (ic.MT.INSTANCE, ic.MT.ID):
+            types[MAINTYPE_NAMES[mtype]] = {"match": True}
+        else:
+            bits = len(digest) * 8
+            types[MAINTYPE_NAMES[mtype]] = {
+                "score": 1.0 if bits else 0.0,
+                "distance": 0,
+                "bits": bits,
+            }
+
+    return {
+        "iscc_a": iscc_code,
+        "iscc_b": iscc_code,
+        "score": 1.0 if types else None,
+        "types": types,
+    }
 
 
 def compare_iscc(iscc_a, iscc_b):
@@ -43,35 +106,33 @@ def compare_iscc(iscc_a, iscc_b):
     :return: Dictionary with score, types breakdown, and input codes
     """
     try:
-        # Decompose both ISCCs into Code objects
-        units_a = [ic.Code(u) for u in ic.iscc_decompose(iscc_a)]
-        units_b = [ic.Code(u) for u in ic.iscc_decompose(iscc_b)]
+        if iscc_a == iscc_b:
+            result = compare_identical(iscc_a)
+            if result is not None:
+                return result
+
+        # Group B digests by packed (maintype, subtype, version) key for a single pass over A
+        digests_b = {}
+        for key, _, digest in decompose_units(iscc_b):
+            digests_b.setdefault(key, []).append(digest)
 
         types = {}
         scores = []
 
         # Find compatible unit pairs (same maintype, subtype, version)
-        for ca in units_a:
-            for cb in units_b:
-                cat = (ca.maintype, ca.subtype, ca.version)
-                cbt = (cb.maintype, cb.subtype, cb.version)
-                if cat != cbt:
-                    continue
-
-                type_name = MAINTYPE_NAMES.get(ca.maintype, ca.maintype.name.lower())
+        for key, mtype, digest_a in decompose_units(iscc_a):
+            for digest_b in digests_b.get(key, ()):
+                type_name = MAINTYPE_NAMES[mtype]
 
                 # Instance and ID types use exact match
-                if ca.maintype in (ic.MT.INSTANCE, ic.MT.ID):
-                    match = ca.hash_bytes == cb.hash_bytes
+                if mtype in (ic.MT.INSTANCE, ic.MT.ID):
+                    match = digest_a == digest_b
                     types[type_name] = {"match": match}
                     scores.append(1.0 if match else 0.0)
                 else:
-                    # Use NPH for normalized comparison of potentially different lengths
-                    nph = ic.iscc_nph_similarity(ca.hash_bytes, cb.hash_bytes)
-                    score = nph["similarity"]
-                    bits = nph["common_prefix_bits"]
-                    # Calculate distance from similarity and bits
-                    distance = round((1.0 - score) * bits)
+                    # Normalized prefix hamming similarity for potentially different lengths
+                    distance, bits = prefix_hamming(digest_a, digest_b)
+                    score = 1.0 - distance / bits if bits else 0.0
                     types[type_name] = {
                         "score": round(score, 4),
                         "distance": distance,
@@ -93,47 +154,102 @@ def compare_iscc(iscc_a, iscc_b):
         return {"error": str(e), "iscc_a": iscc_a, "iscc_b": iscc_b}
 
 
-def format_pretty(result):
-    # type: (dict) -> str
+def compare_many(codes_a, codes_b):
+    # type: (list[str], list[str]) -> Iterator[dict]
     """
-    Format comparison results for human-readable output.
+    Compare every ISCC of one list with every ISCC of another list.
 
-    :param result: Comparison result dictionary
-    :return: Formatted string
+    Each code is decomposed once (see decompose_units) and reused for all its pairs.
+
+    :param codes_a: First list of ISCC codes
+    :param codes_b: Second list of ISCC codes
+    :return: Iterator over comparison results (see compare_iscc), row by row
     """
-    if "error" in result:
-        return f"ERROR: {result['error']}"
+    for iscc_a in codes_a:
+        for iscc_b in codes_b:
+            yield compare_iscc(iscc_a, iscc_b)
+
+
+def read_codes(path):
+    # type: (Path) -> list[str]
+    """
+    Read ISCC codes from a text file with one code per line.
+
+    :param path: Path to the file ('-' for stdin)
+    :return: List of ISCC codes, blank lines skipped
+    """
+    f = sys.stdin if str(path) == "-" else path.open(encoding="utf-8")
+    with f:
+        return [line.strip() for line in f if line.strip()]
+
+
+# Static parts and row templates of the human-readable report
+RULE = "-" * 50
+TABLE_HEADER = f"{'TYPE':<12} {'SCORE':>8} {'DISTANCE':>10} {'BITS':>6}"
+SCORE_ROW = "{0:<12} {1:>8.2f} {2:>10} {3:>6}"
+MATCH_ROW = "{0:<12} {1:>8}"
+
 
-    lines = []
-    lines.append("ISCC Comparison")
-    lines.append("-" * 50)
-    lines.append(f"A: {result['iscc_a']}")
-    lines.append(f"B: {result['iscc_b']}")
-    lines.append("-" * 50)
+def iter_pretty(result):
+    # type: (dict) -> Iterator[str]
+    """
+    Yield the lines of a human-readable comparison report.
+
+    :param result: Comparison result dictionary
+    :return: Iterator over report lines
+    """
+    yield "ISCC Comparison"
+    yield RULE
+    yield f"A: {result['iscc_a']}"
+    yield f"B: {result['iscc_b']}"
+    yield RULE
 
     types = result.get("types", {})
     if types:
-        lines.append(f"{'TYPE':<12} {'SCORE':>8} {'DISTANCE':>10} {'BITS':>6}")
+        yield TABLE_HEADER
         for type_name, data in types.items():
             if "match" in data:
-                match_str = "match" if data["match"] else "no match"
-                lines.append(f"{type_name:<12} {match_str:>8}")
+                yield MATCH_ROW.format(type_name, "match" if data["match"] else "no match")
             else:
-                score_str = f"{data['score']:.2f}"
-                lines.append(
-                    f"{type_name:<12} {score_str:>8} {data['distance']:>10} {data['bits']:>6}"
-                )
+                yield SCORE_ROW.format(type_name, data["score"], data["distance"], data["bits"])
     else:
-        lines.append("No compatible units to compare")
+        yield "No compatible units to compare"
 
-    lines.append("-" * 50)
+    yield RULE
     score = result.get("score")
     if score is not None:
-        lines.append(f"{'OVERALL':<12} {score:.2f}")
+        yield f"{'OVERALL':<12} {score:.2f}"
     else:
-        lines.append("OVERALL      n/a")
+        yield "OVERALL      n/a"
+
+
+def format_pretty(result):
+    # type: (dict) -> str
+    """
+    Format comparison results for human-readable output.
+
+    :param result: Comparison result dictionary
+    :return: Formatted string
+    """
+    if "error" in result:
+        return f"ERROR: {result['error']}"
+
+    return "\n".join(iter_pretty(result))
 
-    return "\n".join(lines)
+
+def run(iscc_a, iscc_b, pretty=False):
+    # type: (str, str, bool) -> tuple[int, str]
+    """
+    Compare two ISCCs and render the command line output.
+
+    :param iscc_a: First ISCC code
+    :param iscc_b: Second ISCC code
+    :param pretty: Render the human-readable report instead of JSON
+    :return: Tuple of exit code (1 if the comparison failed) and output text
+    """
+    result = compare_iscc(iscc_a, iscc_b)
+    output = format_pretty(result) if pretty else json.dumps(result, indent=2)
+    return (1 if "error" in result else 0), output
 
 
 def main():
@@ -146,12 +262,27 @@ def main():
 Examples:
   %(prog)s ISCC:AAAA... ISCC:BBBB...
   %(prog)s --pretty ISCC:AAAA... ISCC:BBBB...
+  %(prog)s --batch-a queries.txt --batch-b candidates.txt > scores.jsonl
         """,
     )
 
-    parser.add_argument("iscc_a", help="First ISCC code to compare")
+    parser.add_argument("iscc_a", nargs="?", help="First ISCC code to compare")
+
+    parser.add_argument("iscc_b", nargs="?", help="Second ISCC code to compare")
 
-    parser.add_argument("iscc_b", help="Second ISCC code to compare")
+    parser.add_argument(
+        "--batch-a",
+        type=Path,
+        metavar="FILE",
+        help="File with one ISCC per line ('-' for stdin), compared with all codes of --batch-b",
+    )
+
+    parser.add_argument(
+        "--batch-b",
+        type=Path,
+        metavar="FILE",
+        help="File with one ISCC per line, writes one JSON line per pair",
+    )
 
     parser.add_argument(
         "--pretty",
@@ -161,20 +292,33 @@ Examples:
 
     args = parser.parse_args()
 
-    # Perform comparison
-    result = compare_iscc(args.iscc_a, args.iscc_b)
-
-    # Output results
-    if args.pretty:
-        print(format_pretty(result))
-    else:
-        print(json.dumps(result, indent=2))
-
-    # Exit with error code if comparison failed
-    if "error" in result:
-        sys.exit(1)
-
-    sys.exit(0)
+    if args.batch_a or args.batch_b:
+        if not (args.batch_a and args.batch_b) or args.iscc_a:
+            parser.error("--batch-a and --batch-b must be used together without ISCC arguments")
+        if str(args.batch_a) == "-" and str(args.batch_b) == "-":
+            parser.error("only one of --batch-a and --batch-b can read from stdin")
+        if args.pretty:
+            parser.error("--pretty cannot be used with --batch-a/--batch-b (output is JSON lines)")
+
+        try:
+            codes_a = read_codes(args.batch_a)
+            codes_b = read_codes(args.batch_b)
+        except OSError as e:
+            print(json.dumps({"error": str(e)}))
+            sys.exit(1)
+
+        failed = False
+        for result in compare_many(codes_a, codes_b):
+            failed = failed or "error" in result
+            print(json.dumps(result, separators=(",", ":")))
+        sys.exit(1 if failed else 0)
+
+    if not args.iscc_b:
+        parser.error("two ISCC codes are required")
+
+    exit_code, output = run(args.iscc_a, args.iscc_b, args.pretty)
+    print(output)
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":  # pragma: no cover
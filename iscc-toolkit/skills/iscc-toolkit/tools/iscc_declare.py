@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-crypto>=0.3.0", "httpx>=0.27.0"]
+# dependencies = ["iscc-crypto>=0.3.0", "httpx[http2]>=0.27.0", "orjson>=3.9"]
 # ///
 """
 ISCC Declaration Tool
@@ -12,14 +12,43 @@ and submits it to the declaration endpoint.
 
 import argparse
 import asyncio
+import functools
 import json
+import os
 import sys
 from datetime import UTC
+from pathlib import Path
 
 import httpx
-from iscc_crypto import create_nonce, key_generate, sign_json
+from iscc_crypto import create_nonce, key_from_secret, key_generate, sign_json
+from iscc_utils import format_output, load_json
 
 DEFAULT_API_URL = "https://sb0.iscc.id/declaration"
+KEYPAIR_PATH_ENV = "ISCC_KEYPAIR_PATH"
+DEFAULT_CONCURRENCY = 16
+
+
+@functools.lru_cache(maxsize=1)
+def get_keypair():
+    # type: () -> object
+    """
+    Get the signing keypair for this process.
+
+    Loads a persisted keypair JSON file (as written by `iscc-crypto setup`) from the
+    path in $ISCC_KEYPAIR_PATH if set. Otherwise generates a keypair once and reuses
+    it for all declarations made by this process.
+
+    Returns:
+        KeyPair object from iscc_crypto
+    """
+    keypair_path = os.environ.get(KEYPAIR_PATH_ENV)
+    if not keypair_path:
+        return key_generate()
+
+    data = load_json(Path(keypair_path).read_bytes())
+    return key_from_secret(
+        data["secret_key"], controller=data.get("controller"), key_id=data.get("key_id")
+    )
 
 
 def create_iscc_note(iscc_code, datahash, keypair):
@@ -57,8 +86,55 @@ def create_iscc_note(iscc_code, datahash, keypair):
     return signed_note
 
 
-async def declare_iscc(iscc_code, api_url, force, datahash):
-    # type: (str, str, bool, str) -> dict
+def create_client():
+    # type: () -> httpx.AsyncClient
+    """
+    Create an HTTP client for declaration requests.
+
+    The client uses HTTP/2 and keeps connections alive, so it should be reused
+    across declarations to avoid repeated TCP and TLS handshakes.
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+
+
+async def submit_note(client, api_url, note):
+    # type: (httpx.AsyncClient, str, dict) -> dict
+    """
+    Submit a signed IsccNote to the declaration endpoint.
+
+    Args:
+        client: HTTP client to use for the request
+        api_url: API endpoint URL
+        note: Signed IsccNote
+
+    Returns:
+        API response as dictionary
+    """
+    try:
+        response = await client.post(api_url, json=note)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        # Try to extract error message from response
+        try:
+            error_data = e.response.json()
+            error_msg = json.dumps(error_data, indent=2)
+        except Exception:
+            error_msg = e.response.text or str(e)
+        raise RuntimeError(f"API error ({e.response.status_code}): {error_msg}") from e
+    except httpx.RequestError as e:
+        raise RuntimeError(f"Request failed: {e}") from e
+
+
+async def declare_iscc(iscc_code, api_url, force, datahash, client=None, keypair=None):
+    # type: (str, str, bool, str, httpx.AsyncClient | None, object | None) -> dict
     """
     Declare ISCC code to the registry.
 
@@ -67,12 +143,14 @@ async def declare_iscc(iscc_code, api_url, force, datahash):
         api_url: API endpoint URL
         force: Override duplicate detection
         datahash: Data hash (required)
+        client: Optional shared HTTP client (a temporary one is created if None)
+        keypair: Optional signing keypair (defaults to the cached process keypair)
 
     Returns:
         API response as dictionary
     """
-    # Generate a new keypair for signing
-    keypair = key_generate()
+    if keypair is None:
+        keypair = get_keypair()
 
     # Create signed note
     note = create_iscc_note(iscc_code, datahash, keypair)
@@ -82,38 +160,70 @@ async def declare_iscc(iscc_code, api_url, force, datahash):
         note["force"] = True
 
     # Submit declaration
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(api_url, json=note)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            # Try to extract error message from response
-            try:
-                error_data = e.response.json()
-                error_msg = json.dumps(error_data, indent=2)
-            except Exception:
-                error_msg = e.response.text or str(e)
-            raise RuntimeError(f"API error ({e.response.status_code}): {error_msg}") from e
-        except httpx.RequestError as e:
-            raise RuntimeError(f"Request failed: {e}") from e
-
-
-def format_output(data, pretty):
-    # type: (dict, bool) -> str
+    if client is None:
+        async with create_client() as client:
+            return await submit_note(client, api_url, note)
+    return await submit_note(client, api_url, note)
+
+
+async def declare_many(iscc_codes, datahashes, api_url, force, concurrency=DEFAULT_CONCURRENCY):
+    # type: (list[str], list[str], str, bool, int) -> list[dict]
     """
-    Format output as JSON.
+    Declare multiple ISCC codes concurrently over a single HTTP client.
 
     Args:
-        data: Data to format
-        pretty: Use human-readable formatting
+        iscc_codes: ISCC codes to declare
+        datahashes: Data hash for each ISCC code
+        api_url: API endpoint URL
+        force: Override duplicate detection
+        concurrency: Maximum number of requests in flight
 
     Returns:
-        JSON string
+        List of API responses (or error dictionaries) in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    keypair = get_keypair()
+
+    async with create_client() as client:
+
+        async def bounded(iscc_code, datahash):
+            # type: (str, str) -> dict
+            async with semaphore:
+                try:
+                    return await declare_iscc(iscc_code, api_url, force, datahash, client, keypair)
+                except Exception as e:
+                    # Keep results of declarations that already reached the registry
+                    return {"iscc_code": iscc_code, "error": str(e)}
+
+        tasks = [bounded(c, d) for c, d in zip(iscc_codes, datahashes, strict=True)]
+        return await asyncio.gather(*tasks)
+
+
+def read_declarations(stream):
+    # type: (BinaryIO) -> tuple[list[str], list[str]]
     """
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    Read ISCC codes and data hashes from a binary stream.
+
+    Each line holds an ISCC code and its data hash separated by whitespace. Lines that
+    do not start with the 'ISCC:' prefix are skipped.
+
+    Args:
+        stream: Binary stream such as sys.stdin.buffer
+
+    Returns:
+        Tuple of ISCC codes and data hashes
+    """
+    iscc_codes = []
+    datahashes = []
+    for raw in stream:
+        if not raw.startswith(b"ISCC:"):
+            continue
+        fields = raw.split()
+        if len(fields) != 2:
+            raise ValueError(f"Expected 'ISCC DATAHASH' per line, got: {raw.strip()!r}")
+        iscc_codes.append(fields[0].decode("ascii"))
+        datahashes.append(fields[1].decode("ascii"))
+    return iscc_codes, datahashes
 
 
 def main():
@@ -127,10 +237,14 @@ Examples:
   %(prog)s ISCC:KACYPXW445FTYNJ3CYSXHAFJMA2HUWULUNRFE3BLHRSCXYH2M5AEGQY
   %(prog)s --force --datahash abc123 ISCC:KACYPXW445FTYNJ3CYSXHAFJMA2HUWULUNRFE3BLHRSCXYH2M5AEGQY
   %(prog)s --api-url https://index.iscc.id/declaration ISCC:KACYPXW445FTYNJ3
+  %(prog)s --stdin < declarations.txt
+
+Stdin format (one declaration per line, results are written as JSON lines):
+  ISCC:KACYPXW445FTYNJ3CYSXHAFJMA2HUWULUNRFE3BLHRSCXYH2M5AEGQY 1e20...
         """,
     )
 
-    parser.add_argument("iscc_code", help="ISCC code to declare")
+    parser.add_argument("iscc_code", nargs="?", help="ISCC code to declare")
 
     parser.add_argument("--force", action="store_true", help="Override duplicate detection")
 
@@ -140,12 +254,37 @@ Examples:
         help=f"Declaration API endpoint (default: {DEFAULT_API_URL})",
     )
 
-    parser.add_argument("--datahash", required=True, help="Data hash (required)")
+    parser.add_argument("--datahash", help="Data hash (required unless --stdin is used)")
+
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Declare 'ISCC DATAHASH' pairs read from stdin (one per line)",
+    )
 
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
 
     args = parser.parse_args()
 
+    if args.stdin:
+        if args.pretty:
+            parser.error("--pretty cannot be used with --stdin (output is JSON lines)")
+        if args.iscc_code or args.datahash:
+            parser.error("ISCC code and --datahash cannot be used with --stdin")
+        try:
+            iscc_codes, datahashes = read_declarations(sys.stdin.buffer)
+            results = asyncio.run(declare_many(iscc_codes, datahashes, args.api_url, args.force))
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        sys.stdout.writelines(format_output(result, False) + "\n" for result in results)
+        return 0 if all("error" not in result for result in results) else 1
+
+    if not args.iscc_code or not args.datahash:
+        print("Error: ISCC code and --datahash are required (or use --stdin)", file=sys.stderr)
+        return 1
+
     # Validate ISCC code format
     if not args.iscc_code.startswith("ISCC:"):
         print("Error: ISCC code must start with 'ISCC:' prefix", file=sys.stderr)
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-sdk>=0.7.0"]
+# dependencies = ["iscc-sdk>=0.7.0", "orjson>=3.9"]
 # ///
 """
 ISCC Media Type Detection Tool
@@ -11,27 +11,36 @@ Reports whether a file is supported for ISCC code generation.
 """
 
 import argparse
-import json
+import functools
+import os
+import stat
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import iscc_sdk as idk
+from iscc_utils import format_output
 
+# Files handed to a worker process per task when detecting many files
+PROCESS_CHUNKSIZE = 16
 
-def detect_media_type(file_path, verbose):
-    # type: (Path, bool) -> dict
+
+def detect_media_type(file_path, verbose, file_size=None):
+    # type: (Path, bool, Optional[int]) -> dict
     """
     Detect media type and ISCC processing characteristics.
 
     Args:
         file_path: Path to the media file
         verbose: Include detailed detection information
+        file_size: File size in bytes if already known (avoids another stat call)
 
     Returns:
         Dictionary containing detection results
     """
     # Get file size
-    file_size = file_path.stat().st_size
+    if file_size is None:
+        file_size = file_path.stat().st_size
 
     # Detect MIME type
     try:
@@ -67,6 +76,57 @@ def detect_media_type(file_path, verbose):
     return result
 
 
+def detect_one(file_path, verbose):
+    # type: (Path, bool) -> dict
+    """
+    Detect media type for one file, capturing errors in the result.
+
+    Args:
+        file_path: Path to the media file
+        verbose: Include detailed detection information
+
+    Returns:
+        Detection result, or dictionary with file path and error message
+    """
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return {"file": str(file_path), "error": "File not found"}
+
+    if not stat.S_ISREG(st.st_mode):
+        return {"file": str(file_path), "error": "Not a regular file"}
+
+    try:
+        return detect_media_type(file_path, verbose, st.st_size)
+    except Exception as e:
+        return {"file": str(file_path), "error": str(e)}
+
+
+def detect_many(file_paths, verbose, workers=1):
+    # type: (list[Path], bool, int) -> Iterator[dict]
+    """
+    Detect media types for multiple files, in parallel worker processes if requested.
+
+    Each worker imports iscc-sdk (and with it libmagic) once and reuses it for all its files.
+
+    Args:
+        file_paths: Paths to media files
+        verbose: Include detailed detection information
+        workers: Number of worker processes
+
+    Returns:
+        Iterator over results in input order (see detect_one)
+    """
+    if workers <= 1 or len(file_paths) <= 1:
+        for file_path in file_paths:
+            yield detect_one(file_path, verbose)
+        return
+
+    task = functools.partial(detect_one, verbose=verbose)
+    with ProcessPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+        yield from executor.map(task, file_paths, chunksize=PROCESS_CHUNKSIZE)
+
+
 def format_size(size_bytes):
     # type: (int) -> str
     """
@@ -85,26 +145,21 @@ def format_size(size_bytes):
     return f"{size_bytes:.1f} PB"
 
 
-def format_output(data, pretty):
-    # type: (dict | list, bool) -> str
+def parse_args():
+    # type: () -> argparse.Namespace
     """
-    Format output as JSON.
+    Parse command line arguments.
 
-    Args:
-        data: Data to format
-        pretty: Use human-readable formatting
+    A single file argument without options skips building the argument parser.
 
     Returns:
-        JSON string
+        Parsed arguments
     """
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
-
+    if len(sys.argv) == 2:
+        arg = sys.argv[1]
+        if not arg.startswith("-"):
+            return argparse.Namespace(files=[Path(arg)], verbose=False, pretty=False, workers=1)
 
-def main():
-    # type: () -> int
-    """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Detect media type and ISCC processing mode",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -114,6 +169,7 @@ Examples:
   %(prog)s --verbose document.pdf
   %(prog)s --pretty audio.mp3
   %(prog)s *.jpg
+  %(prog)s --workers 8 media/*
         """,
     )
 
@@ -125,27 +181,30 @@ Examples:
 
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parallel workers for multiple files (default: CPU count)",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    # type: () -> int
+    """Main entry point."""
+    args = parse_args()
 
     try:
         results = []
         errors = []
 
-        for file_path in args.files:
-            # Validate file exists
-            if not file_path.exists():
-                errors.append({"file": str(file_path), "error": "File not found"})
-                continue
-
-            if not file_path.is_file():
-                errors.append({"file": str(file_path), "error": "Not a regular file"})
-                continue
-
-            try:
-                result = detect_media_type(file_path, args.verbose)
+        for result in detect_many(args.files, args.verbose, args.workers):
+            if "error" in result:
+                errors.append(result)
+            else:
                 results.append(result)
-            except Exception as e:
-                errors.append({"file": str(file_path), "error": str(e)})
 
         # Prepare output
         if len(args.files) == 1 and results:
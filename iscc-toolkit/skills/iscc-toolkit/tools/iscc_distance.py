@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-core>=1.0.0"]
+# dependencies = ["iscc-core>=1.0.0", "numpy>=1.24", "orjson>=3.9"]
 # ///
 """Calculate Hamming distance between ISCC codes.
 
@@ -10,19 +10,249 @@ comparing one ISCC against multiple candidates.
 """
 
 import argparse
-import json
+import mmap
 import sys
+from base64 import b32decode
 from pathlib import Path
 
 try:
     import iscc_core as ic
+    import numpy as np
 except ImportError:
     print(
-        "Error: iscc-core is not installed. Install with: pip install iscc-core",
+        "Error: iscc-core and numpy are required. Install with: pip install iscc-core numpy",
         file=sys.stderr,
     )
     sys.exit(1)
 
+from iscc_utils import format_output
+
+# Number of set bits for every possible byte value (vectorized popcount)
+POPCNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# NumPy >= 2.0 provides a popcount ufunc backed by the hardware instruction
+HAS_BITWISE_COUNT = hasattr(np, "bitwise_count")
+
+# Base32 symbol values for every possible byte value (0xFF marks invalid symbols)
+B32_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+B32_LUT = np.full(256, 0xFF, dtype=np.uint8)
+B32_LUT[np.frombuffer(B32_ALPHABET, dtype=np.uint8)] = np.arange(32, dtype=np.uint8)
+B32_LUT[np.frombuffer(B32_ALPHABET.lower(), dtype=np.uint8)] = np.arange(32, dtype=np.uint8)
+
+# Candidate rows processed per block so the XOR scratch buffer stays cache resident
+BLOCK_ROWS = 16384
+
+# Same message as iscc_core for codes without a similarity-preserving digest
+ID_V1_ERROR = "Similarity comparison not supported for ISCC-IDv1"
+
+
+def hamming_rows(cand, ref):
+    # type: (np.ndarray, np.ndarray) -> np.ndarray
+    """
+    Calculate Hamming distances between each row of a digest matrix and a reference.
+
+    Digests with a length that is a multiple of 8 bytes are processed as 64-bit words
+    with a native popcount. Other lengths fall back to the byte lookup table. Rows are
+    processed in blocks that reuse a single XOR scratch buffer.
+
+    :param cand: Candidate digests as contiguous uint8 matrix of shape (N, nbytes)
+    :param ref: Reference digest as uint8 array of shape (nbytes,)
+    :return: Hamming distances as int64 array of shape (N,)
+    """
+    n_rows, n_bytes = cand.shape
+    out = np.empty(n_rows, dtype=np.int64)
+    scratch = np.empty((min(n_rows, BLOCK_ROWS), n_bytes), dtype=np.uint8)
+    use_words = HAS_BITWISE_COUNT and n_bytes % 8 == 0
+
+    for start in range(0, n_rows, BLOCK_ROWS):
+        block = cand[start : start + BLOCK_ROWS]
+        xor = np.bitwise_xor(block, ref, out=scratch[: len(block)])
+        if use_words:
+            # Popcount is byte-order independent, so native words avoid any byteswap
+            counts = np.bitwise_count(xor.view(np.uint64))
+        else:
+            counts = POPCNT[xor]
+        counts.sum(axis=1, dtype=np.int64, out=out[start : start + len(block)])
+
+    return out
+
+
+def decode_base32_batch(codes, n_bytes):
+    # type: (list[bytes], int) -> tuple[np.ndarray, np.ndarray]
+    """
+    Decode equal-length base32 codes to raw bytes in one vectorized pass.
+
+    All symbols are translated with a lookup table, expanded to their 5-bit groups and
+    repacked into bytes. Rows containing invalid symbols are flagged in the returned mask.
+
+    :param codes: Unpadded base32 codes of identical length
+    :param n_bytes: Number of decoded bytes per code
+    :return: Tuple of uint8 matrix of shape (N, n_bytes) and boolean validity mask
+    """
+    symbols = np.frombuffer(b"".join(codes), dtype=np.uint8).reshape(len(codes), -1)
+    values = B32_LUT.take(symbols)
+    valid = (values != 0xFF).all(axis=1)
+    bits = np.unpackbits(values[:, :, None], axis=2)[:, :, 3:].reshape(len(codes), -1)
+    return np.packbits(bits[:, : n_bytes * 8], axis=1), valid
+
+
+def hamming_bytes(a, b):
+    # type: (bytes, bytes) -> int
+    """
+    Calculate Hamming distance between two equal-length digests.
+
+    Both digests are packed into single integers so the XOR and popcount run
+    over machine words instead of individual bytes.
+
+    :param a: First digest
+    :param b: Second digest
+    :return: Hamming distance in bits
+    """
+    return (int.from_bytes(a, byteorder="big") ^ int.from_bytes(b, byteorder="big")).bit_count()
+
+
+def decode_iscc(iscc):
+    # type: (str) -> bytes
+    """
+    Decode an ISCC code to its raw bytes (header + digest).
+
+    :param iscc: ISCC code (with or without "ISCC:" prefix)
+    :return: Raw ISCC bytes
+    """
+    return ic.decode_base32(ic.iscc_clean(iscc))
+
+
+def decode_iscc_bytes(raw):
+    # type: (bytes) -> bytes
+    """
+    Decode an ASCII encoded ISCC code to its raw bytes without creating a str.
+
+    :param raw: ISCC code as bytes (with or without "ISCC:" prefix)
+    :return: Raw ISCC bytes
+    """
+    scheme, sep, code = raw.rpartition(b":")
+    if sep and scheme.strip().lower() != b"iscc":
+        raise ValueError(f"Invalid scheme: {scheme.decode(errors='replace')}")
+    code = code.strip().replace(b"-", b"")
+    return b32decode(code + b"=" * (-len(code) % 8), casefold=True)
+
+
+def iter_lines(path):
+    # type: (Path) -> Iterator[bytes]
+    """
+    Yield non-empty, whitespace-stripped lines of a file as bytes.
+
+    The file is memory-mapped and scanned for line boundaries, so only one line
+    is materialized at a time.
+
+    :param path: Path to text file
+    :return: Iterator over stripped line bytes
+    """
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file
+        if not f.seek(0, 2):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            size = len(mm)
+            while pos < size:
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    end = size
+                line = mm[pos:end].strip()
+                if line:
+                    yield line
+                pos = end + 1
+
+
+def iter_stream_lines(stream):
+    # type: (BinaryIO) -> Iterator[bytes]
+    """
+    Yield non-empty, whitespace-stripped lines of a binary stream as bytes.
+
+    :param stream: Binary stream such as `sys.stdin.buffer`
+    :return: Iterator over stripped line bytes
+    """
+    for raw in stream:
+        line = raw.strip()
+        if line:
+            yield line
+
+
+def is_iscc_id_v1(raw):
+    # type: (bytes) -> bool
+    """
+    Check if raw ISCC bytes are an ISCC-IDv1, which has no similarity-preserving digest.
+
+    :param raw: Raw ISCC bytes (header + digest)
+    :return: True for ISCC-IDv1 codes
+    """
+    maintype, _, version, _, _ = ic.decode_header(raw)
+    return maintype == ic.MT.ID and version == ic.VS.V1
+
+
+def mismatch_error(reference_iscc, candidate):
+    # type: (str, bytes) -> dict
+    """
+    Build error entry for a candidate whose type or length differs from the reference.
+
+    :param reference_iscc: Reference ISCC code
+    :param candidate: Candidate ISCC code as bytes
+    :return: Error dictionary
+    """
+    try:
+        id_v1 = is_iscc_id_v1(decode_iscc_bytes(candidate))
+    except Exception:
+        id_v1 = False
+    return {
+        "error": ID_V1_ERROR if id_v1 else "ISCC type or length does not match reference",
+        "iscc_a": reference_iscc,
+        "iscc_b": candidate.decode("ascii"),
+    }
+
+
+def build_result(iscc_a, iscc_b, distance, total_bits, threshold=None):
+    # type: (str, str, int, int, int) -> dict
+    """
+    Build distance result dictionary from a precomputed Hamming distance.
+
+    :param iscc_a: First ISCC code
+    :param iscc_b: Second ISCC code
+    :param distance: Hamming distance in bits
+    :param total_bits: Number of compared digest bits
+    :param threshold: Optional similarity threshold (0-100)
+    :return: Dictionary containing distance metrics
+    """
+    # Calculate similarity percentage
+    matching_bits = total_bits - distance
+    similarity_pct = (matching_bits / total_bits * 100) if total_bits > 0 else 0
+
+    # Assess match quality
+    match_assessment = "no match"
+    if similarity_pct >= 90:
+        match_assessment = "strong match"
+    elif similarity_pct >= 75:
+        match_assessment = "good match"
+    elif similarity_pct >= 50:
+        match_assessment = "weak match"
+
+    result = {
+        "iscc_a": iscc_a,
+        "iscc_b": iscc_b,
+        "hamming_distance": distance,
+        "total_bits": total_bits,
+        "matching_bits": matching_bits,
+        "similarity_percentage": round(similarity_pct, 2),
+        "match_assessment": match_assessment,
+    }
+
+    # Check against threshold if provided
+    if threshold is not None:
+        result["meets_threshold"] = similarity_pct >= threshold
+        result["threshold"] = threshold
+
+    return result
+
 
 def calculate_distance(iscc_a, iscc_b, threshold=None):
     # type: (str, str, int) -> dict
@@ -35,78 +265,130 @@ def calculate_distance(iscc_a, iscc_b, threshold=None):
     :return: Dictionary containing distance metrics
     """
     try:
-        # Calculate Hamming distance
-        distance = ic.hamming_distance(iscc_a, iscc_b)
-
-        # Calculate similarity percentage
-        # Each base32 character represents 5 bits
-        total_bits = min(len(iscc_a), len(iscc_b)) * 5
-        matching_bits = total_bits - distance
-        similarity_pct = (matching_bits / total_bits * 100) if total_bits > 0 else 0
-
-        # Assess match quality
-        match_assessment = "no match"
-        if similarity_pct >= 90:
-            match_assessment = "strong match"
-        elif similarity_pct >= 75:
-            match_assessment = "good match"
-        elif similarity_pct >= 50:
-            match_assessment = "weak match"
-
-        # Check against threshold if provided
-        meets_threshold = None
-        if threshold is not None:
-            meets_threshold = similarity_pct >= threshold
-
-        result = {
-            "iscc_a": iscc_a,
-            "iscc_b": iscc_b,
-            "hamming_distance": distance,
-            "total_bits": total_bits,
-            "matching_bits": matching_bits,
-            "similarity_percentage": round(similarity_pct, 2),
-            "match_assessment": match_assessment,
-        }
-
-        if meets_threshold is not None:
-            result["meets_threshold"] = meets_threshold
-            result["threshold"] = threshold
-
-        return result
-
+        # Raises if MainType, SubType, Version or Length do not match
+        digest_a, digest_b = ic.utils.iscc_pair_unpack(iscc_a, iscc_b)
+        distance = hamming_bytes(digest_a, digest_b)
+        return build_result(iscc_a, iscc_b, distance, len(digest_a) * 8, threshold)
     except Exception as e:
         return {"error": str(e), "iscc_a": iscc_a, "iscc_b": iscc_b}
 
 
-def batch_compare(reference_iscc, candidate_file, threshold=None):
-    # type: (str, Path, int) -> dict
+def batch_compare(reference_iscc, candidate_file, threshold=None, top=None):
+    # type: (str, Path | str, int, int) -> dict
     """
-    Compare reference ISCC against multiple candidates from a file.
+    Compare reference ISCC against multiple candidates from a file or stdin.
 
     :param reference_iscc: Reference ISCC code
-    :param candidate_file: Path to file containing candidate ISCCs (one per line)
+    :param candidate_file: Path to file containing candidate ISCCs (one per line) or '-'
+        to read candidates from stdin
     :param threshold: Optional similarity threshold
+    :param top: Optional number of most similar candidates to return (omits error entries)
     :return: Dictionary containing batch comparison results
     """
     try:
-        # Read candidate ISCCs from file
-        with open(candidate_file, encoding="utf-8") as f:
-            candidates = [line.strip() for line in f if line.strip()]
-
-        # Compare against each candidate
+        # Decode reference once
+        ref_bytes = decode_iscc(ic.iscc_normalize(reference_iscc))
+        if is_iscc_id_v1(ref_bytes):
+            raise ValueError(ID_V1_ERROR)
+        header_size = len(ref_bytes) - len(ic.decode_header(ref_bytes)[-1])
+        ref_header = ref_bytes[:header_size]
+
+        # Stream candidate lines from the mapped file. Plain codes with the same length
+        # as the reference are decoded together; anything else is decoded one by one.
+        ref_code = ic.iscc_clean(ic.iscc_normalize(reference_iscc)).encode("ascii")
+        candidates = []
         comparisons = []
-        for candidate in candidates:
-            result = calculate_distance(reference_iscc, candidate, threshold)
-            comparisons.append(result)
-
-        # Sort by similarity (descending)
-        comparisons.sort(key=lambda x: x.get("similarity_percentage", 0), reverse=True)
-
-        # Find best matches
+        batch_codes = []
+        batch_index = []
+        rows = bytearray()
+        row_index = []
+        if candidate_file == "-":
+            lines = iter_stream_lines(sys.stdin.buffer)
+        else:
+            lines = iter_lines(candidate_file)
+        for i, line in enumerate(lines):
+            candidates.append(line)
+            comparisons.append(None)
+            code = line[5:] if line[:5].lower() == b"iscc:" else line
+            if len(code) == len(ref_code):
+                batch_codes.append(code)
+                batch_index.append(i)
+                continue
+            try:
+                cand_bytes = decode_iscc_bytes(line)
+            except Exception as e:
+                comparisons[i] = {
+                    "error": str(e),
+                    "iscc_a": reference_iscc,
+                    "iscc_b": line.decode("utf-8", errors="replace"),
+                }
+                continue
+            if len(cand_bytes) != len(ref_bytes) or cand_bytes[:header_size] != ref_header:
+                comparisons[i] = mismatch_error(reference_iscc, line)
+                continue
+            rows += memoryview(cand_bytes)[header_size:]
+            row_index.append(i)
+
+        # Build one digest matrix (headers must match the reference). Digests are
+        # appended to a single buffer and exposed to NumPy without copying.
+        digest_size = len(ref_bytes) - header_size
+        digests = []
+        if rows:
+            digests.append(np.frombuffer(rows, dtype=np.uint8).reshape(-1, digest_size))
+        if batch_codes:
+            decoded, valid = decode_base32_batch(batch_codes, len(ref_bytes))
+            header = np.frombuffer(ref_header, dtype=np.uint8)
+            matches = valid & (decoded[:, :header_size] == header).all(axis=1)
+            for i, is_valid, is_match in zip(
+                batch_index, valid.tolist(), matches.tolist(), strict=True
+            ):
+                if is_match:
+                    row_index.append(i)
+                elif is_valid:
+                    comparisons[i] = mismatch_error(reference_iscc, candidates[i])
+                else:
+                    comparisons[i] = {
+                        "error": "Non-base32 digit found",
+                        "iscc_a": reference_iscc,
+                        "iscc_b": candidates[i].decode("utf-8", errors="replace"),
+                    }
+            if matches.any():
+                digests.append(decoded[matches, header_size:])
+
+        # Error entries (in input order) are listed after all ranked candidates
+        errors = [c for c in comparisons if c is not None]
+        ranked = []
+        matches_above_threshold = 0
+
+        # XOR + popcount all candidates against the reference in one vectorized pass
+        if row_index:
+            ref = np.frombuffer(ref_bytes, dtype=np.uint8, offset=header_size)
+            cand = digests[0] if len(digests) == 1 else np.concatenate(digests)
+            distances = hamming_rows(cand, ref)
+
+            # Rank by similarity (descending, ties in input order) without building
+            # result dictionaries for candidates that are not returned
+            index = np.array(row_index)
+            total_bits = digest_size * 8
+            similarity = (total_bits - distances) / total_bits * 100
+            rank_key = -np.round(similarity, 2)
+            if top is not None and top < len(row_index):
+                selected = np.argpartition(rank_key, top - 1)[:top]
+                order = selected[np.lexsort((index[selected], rank_key[selected]))]
+            else:
+                order = np.lexsort((index, rank_key))
+            if threshold is not None:
+                matches_above_threshold = int(np.count_nonzero(similarity >= threshold))
+
+            for j in order.tolist():
+                candidate = candidates[row_index[j]].decode("ascii")
+                distance = int(distances[j])
+                ranked.append(
+                    build_result(reference_iscc, candidate, distance, total_bits, threshold)
+                )
+
+        comparisons = ranked if top is not None else ranked + errors
         best_match = comparisons[0] if comparisons else None
-        matches_above_threshold = []
-        if threshold is not None:
-            matches_above_threshold = [c for c in comparisons if c.get("meets_threshold", False)]
 
         result = {
             "reference_iscc": reference_iscc,
@@ -117,7 +399,7 @@ def batch_compare(reference_iscc, candidate_file, threshold=None):
 
         if threshold is not None:
             result["threshold"] = threshold
-            result["matches_above_threshold"] = len(matches_above_threshold)
+            result["matches_above_threshold"] = matches_above_threshold
 
         return result
 
@@ -129,75 +411,97 @@ def batch_compare(reference_iscc, candidate_file, threshold=None):
         }
 
 
-def format_pretty(result, is_batch=False):
-    # type: (dict, bool) -> str
+# Static parts of the human-readable report
+SEPARATOR = "=" * 70 + "\n"
+RULE = "-" * 70 + "\n"
+BATCH_HEADER = SEPARATOR + "ISCC Batch Distance Comparison\n" + SEPARATOR
+SINGLE_HEADER = SEPARATOR + "ISCC Hamming Distance Calculation\n" + SEPARATOR
+BEST_MATCH_TEMPLATE = (
+    "Best Match:\n"
+    "  ISCC: {iscc_b}\n"
+    "  Distance: {hamming_distance}\n"
+    "  Similarity: {similarity_percentage}%\n"
+    "  Assessment: {match_assessment}\n"
+)
+COMPARISON_TEMPLATE = (
+    "\n{rank}. {iscc_b}{status}\n"
+    "   Distance: {hamming_distance} | Similarity: {similarity_percentage}% | "
+    "{match_assessment}\n"
+)
+SINGLE_TEMPLATE = (
+    "ISCC A: {iscc_a}\n"
+    "ISCC B: {iscc_b}\n"
+    "{rule}"
+    "Hamming Distance: {hamming_distance}\n"
+    "Total Bits: {total_bits}\n"
+    "Matching Bits: {matching_bits}\n"
+    "Similarity: {similarity_percentage}%\n"
+    "Assessment: {match_assessment}\n"
+)
+
+
+def iter_pretty(result, is_batch=False):
+    # type: (dict, bool) -> Iterator[str]
     """
-    Format distance calculation results for human-readable output.
+    Yield the human-readable report for distance calculation results in chunks.
+
+    Every chunk ends with a newline, so the report can be streamed with
+    `sys.stdout.writelines` without building the full output in memory.
 
     :param result: Distance calculation result dictionary
     :param is_batch: Whether this is a batch comparison result
-    :return: Formatted string
+    :return: Iterator over output chunks
     """
     if "error" in result:
-        return f"ERROR: {result['error']}"
-
-    lines = []
-    lines.append("=" * 70)
+        yield f"ERROR: {result['error']}\n"
+        return
 
     if is_batch:
-        lines.append("ISCC Batch Distance Comparison")
-        lines.append("=" * 70)
-        lines.append(f"Reference ISCC: {result['reference_iscc']}")
-        lines.append(f"Total Candidates: {result['total_candidates']}")
+        yield BATCH_HEADER
+        yield f"Reference ISCC: {result['reference_iscc']}\n"
+        yield f"Total Candidates: {result['total_candidates']}\n"
         if "threshold" in result:
-            lines.append(f"Threshold: {result['threshold']}%")
-            lines.append(f"Matches Above Threshold: {result['matches_above_threshold']}")
-        lines.append("-" * 70)
+            yield f"Threshold: {result['threshold']}%\n"
+            yield f"Matches Above Threshold: {result['matches_above_threshold']}\n"
+        yield RULE
 
         if result.get("best_match"):
-            best = result["best_match"]
-            lines.append("Best Match:")
-            lines.append(f"  ISCC: {best['iscc_b']}")
-            lines.append(f"  Distance: {best['hamming_distance']}")
-            lines.append(f"  Similarity: {best['similarity_percentage']}%")
-            lines.append(f"  Assessment: {best['match_assessment']}")
-            lines.append("-" * 70)
-
-        lines.append("\nAll Comparisons (sorted by similarity):")
+            yield BEST_MATCH_TEMPLATE.format_map(result["best_match"])
+            yield RULE
+
+        yield "\nAll Comparisons (sorted by similarity):\n"
         for i, comp in enumerate(result["comparisons"], 1):
             if "error" in comp:
-                lines.append(f"\n{i}. ERROR: {comp['error']}")
+                yield f"\n{i}. ERROR: {comp['error']}\n"
                 continue
 
             status = ""
             if "meets_threshold" in comp:
                 status = " ✓" if comp["meets_threshold"] else " ✗"
 
-            lines.append(f"\n{i}. {comp['iscc_b']}{status}")
-            dist = comp["hamming_distance"]
-            sim = comp["similarity_percentage"]
-            match = comp["match_assessment"]
-            lines.append(f"   Distance: {dist} | Similarity: {sim}% | {match}")
+            yield COMPARISON_TEMPLATE.format_map({**comp, "rank": i, "status": status})
 
     else:
-        lines.append("ISCC Hamming Distance Calculation")
-        lines.append("=" * 70)
-        lines.append(f"ISCC A: {result['iscc_a']}")
-        lines.append(f"ISCC B: {result['iscc_b']}")
-        lines.append("-" * 70)
-        lines.append(f"Hamming Distance: {result['hamming_distance']}")
-        lines.append(f"Total Bits: {result['total_bits']}")
-        lines.append(f"Matching Bits: {result['matching_bits']}")
-        lines.append(f"Similarity: {result['similarity_percentage']}%")
-        lines.append(f"Assessment: {result['match_assessment']}")
+        yield SINGLE_HEADER
+        yield SINGLE_TEMPLATE.format_map({**result, "rule": RULE})
 
         if "meets_threshold" in result:
             status = "YES ✓" if result["meets_threshold"] else "NO ✗"
-            lines.append(f"Meets Threshold ({result['threshold']}%): {status}")
+            yield f"Meets Threshold ({result['threshold']}%): {status}\n"
+
+    yield SEPARATOR
 
-    lines.append("=" * 70)
 
-    return "\n".join(lines)
+def format_pretty(result, is_batch=False):
+    # type: (dict, bool) -> str
+    """
+    Format distance calculation results for human-readable output.
+
+    :param result: Distance calculation result dictionary
+    :param is_batch: Whether this is a batch comparison result
+    :return: Formatted string
+    """
+    return "".join(iter_pretty(result, is_batch)).removesuffix("\n")
 
 
 def main():
@@ -212,6 +516,7 @@ Examples:
   %(prog)s --threshold 80 ISCC:AAAA... ISCC:BBBB...
   %(prog)s --batch candidates.txt ISCC:AAAA...
   %(prog)s --pretty --threshold 75 --batch candidates.txt ISCC:AAAA...
+  cat candidates.txt | %(prog)s --batch - ISCC:AAAA...
 
 Batch file format (one ISCC per line):
   ISCC:KACYPXW445FTYNJ4HHKGUM
@@ -241,7 +546,14 @@ Batch file format (one ISCC per line):
         "--batch",
         type=Path,
         metavar="FILE",
-        help="Batch mode: compare against ISCCs from file (one per line)",
+        help="Batch mode: compare against ISCCs from file (one per line) or '-' for stdin",
+    )
+
+    parser.add_argument(
+        "--top",
+        type=int,
+        metavar="K",
+        help="Batch mode: only return the K most similar candidates",
     )
 
     args = parser.parse_args()
@@ -252,14 +564,19 @@ Batch file format (one ISCC per line):
             print("Error: Threshold must be between 0 and 100", file=sys.stderr)
             sys.exit(1)
 
+    if args.top is not None and args.top < 1:
+        print("Error: --top must be a positive integer", file=sys.stderr)
+        sys.exit(1)
+
     # Perform calculation
     if args.batch:
         # Batch mode
-        if not args.batch.exists():
+        if str(args.batch) != "-" and not args.batch.exists():
             print(f"Error: File not found: {args.batch}", file=sys.stderr)
             sys.exit(1)
 
-        result = batch_compare(args.iscc_a, args.batch, args.threshold)
+        candidate_file = "-" if str(args.batch) == "-" else args.batch
+        result = batch_compare(args.iscc_a, candidate_file, args.threshold, args.top)
         is_batch = True
     else:
         # Single comparison mode
@@ -275,9 +592,9 @@ Batch file format (one ISCC per line):
 
     # Output results
     if args.pretty:
-        print(format_pretty(result, is_batch))
+        sys.stdout.writelines(iter_pretty(result, is_batch))
     else:
-        print(json.dumps(result, indent=2))
+        print(format_output(result, pretty=True))
 
     # Exit with error code if calculation failed
     if "error" in result:
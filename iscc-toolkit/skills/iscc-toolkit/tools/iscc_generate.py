@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-sdk>=0.7.0"]
+# dependencies = ["iscc-sdk>=0.7.0", "orjson>=3.9"]
 # ///
 """
 ISCC Code Generator
@@ -11,11 +11,13 @@ Returns full IsccMeta object with all generated units and metadata.
 """
 
 import argparse
-import json
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import iscc_sdk as idk
+from iscc_utils import format_output, read_paths
 
 
 def generate_iscc(file_path, bits, granular, meta_only):
@@ -32,10 +34,12 @@ def generate_iscc(file_path, bits, granular, meta_only):
     Returns:
         Dictionary containing IsccMeta fields
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Not a file: {file_path}")
 
     # Generate ISCC code
@@ -67,21 +71,50 @@ def generate_iscc(file_path, bits, granular, meta_only):
         raise RuntimeError(f"Failed to generate ISCC: {e}") from e
 
 
-def format_output(data, pretty):
-    # type: (dict, bool) -> str
+def generate_one(file_path, bits, granular, meta_only):
+    # type: (Path, int, bool, bool) -> dict
+    """
+    Generate ISCC code for one file of a batch, capturing errors in the result.
+
+    Args:
+        file_path: Path to media file
+        bits: Bit length for ISCC codes
+        granular: Include granular features
+        meta_only: Only generate from metadata
+
+    Returns:
+        Dictionary with file path and IsccMeta fields or error message
+    """
+    try:
+        return {"file": str(file_path), "iscc": generate_iscc(file_path, bits, granular, meta_only)}
+    except Exception as e:
+        return {"file": str(file_path), "error": str(e)}
+
+
+def generate_many(file_paths, bits, granular, meta_only, workers=1):
+    # type: (Iterable[Path], int, bool, bool, int) -> Iterator[dict]
     """
-    Format output as JSON.
+    Generate ISCC codes for multiple files within a single process.
+
+    Results are yielded in input order as soon as they are available.
 
     Args:
-        data: Data to format
-        pretty: Use human-readable formatting
+        file_paths: Paths to media files
+        bits: Bit length for ISCC codes
+        granular: Include granular features
+        meta_only: Only generate from metadata
+        workers: Number of parallel worker threads
 
     Returns:
-        JSON string
+        Iterator over result dictionaries (see generate_one)
     """
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    if workers <= 1:
+        for file_path in file_paths:
+            yield generate_one(file_path, bits, granular, meta_only)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(lambda fp: generate_one(fp, bits, granular, meta_only), file_paths)
 
 
 def main():
@@ -96,10 +129,19 @@ Examples:
   %(prog)s --bits 128 image.jpg
   %(prog)s --granular --pretty video.mp4
   %(prog)s --meta-only audio.mp3
+  find docs -name "*.pdf" | %(prog)s --stdin-files --workers 4
         """,
     )
 
-    parser.add_argument("file", type=Path, help="Media file to process")
+    source = parser.add_mutually_exclusive_group(required=True)
+
+    source.add_argument("file", type=Path, nargs="?", help="Media file to process")
+
+    source.add_argument(
+        "--stdin-files",
+        action="store_true",
+        help="Read file paths from stdin (one per line) and write JSON lines",
+    )
 
     parser.add_argument(
         "--bits",
@@ -120,10 +162,28 @@ Examples:
         help="Skip content processing, only generate from metadata",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel workers for --stdin-files (default: 1)",
+    )
+
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
 
     args = parser.parse_args()
 
+    if args.stdin_files:
+        if args.pretty:
+            parser.error("--pretty cannot be used with --stdin-files (output is JSON lines)")
+        paths = read_paths(Path("-"))
+        results = generate_many(paths, args.bits, args.granular, args.meta_only, args.workers)
+        failed = False
+        for result in results:
+            failed = failed or "error" in result
+            print(format_output(result, args.pretty), flush=True)
+        return 1 if failed else 0
+
     try:
         result = generate_iscc(args.file, args.bits, args.granular, args.meta_only)
         print(format_output(result, args.pretty))
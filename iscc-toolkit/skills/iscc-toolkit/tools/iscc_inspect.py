@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-core>=1.0.0"]
+# dependencies = ["iscc-core>=1.0.0", "orjson>=3.9"]
 # ///
 """Decompose and inspect ISCC-CODEs.
 
@@ -10,7 +10,7 @@ version, length, and binary representations.
 """
 
 import argparse
-import json
+import functools
 import sys
 
 try:
@@ -22,6 +22,125 @@ except ImportError:
     )
     sys.exit(1)
 
+from iscc_utils import format_output
+
+# Translation table from hex digits to their 4-bit binary strings
+HEX_TO_BITS = str.maketrans({f"{i:x}": f"{i:04b}" for i in range(16)})
+
+
+def format_binary(data):
+    # type: (bytes) -> str
+    """
+    Format bytes as a binary literal in linear time (same output as `bin(int.from_bytes(data))`).
+
+    :param data: Raw bytes
+    :return: Binary string with "0b" prefix and without leading zeros
+    """
+    return "0b" + (data.hex().translate(HEX_TO_BITS).lstrip("0") or "0")
+
+
+@functools.lru_cache(maxsize=4096)
+def explain_unit(unit):
+    # type: (str) -> str
+    """
+    Explain an ISCC unit (memoized for repeated units across codes).
+
+    :param unit: ISCC unit
+    :return: Human-readable explanation
+    """
+    return ic.iscc_explain(unit)
+
+
+def explain_fields(mtype, stype, version, length, digest):
+    # type: (int, int, int, Union[int, str], bytes) -> str
+    """
+    Build the `iscc_explain` representation from already decoded header fields.
+
+    :param mtype: MainType of the ISCC
+    :param stype: SubType of the ISCC
+    :param version: Version of the ISCC
+    :param length: Length in bits (or unit composition for ISCC-CODEs)
+    :param digest: Digest bytes
+    :return: Human-readable explanation
+    """
+    subtype = ic.SUBTYPE_MAP[(mtype, version)](stype)
+    return f"{ic.MT(mtype).name}-{subtype.name}-{ic.VS(version).name}-{length}-{digest.hex()}"
+
+
+def build_unit(mtype, stype, version, bit_length, digest):
+    # type: (int, int, int, int, bytes) -> tuple[str, str, bytes]
+    """
+    Encode an ISCC-UNIT and explain it without decoding it again.
+
+    :param mtype: MainType of the unit
+    :param stype: SubType of the unit
+    :param version: Version of the unit
+    :param bit_length: Length of the unit in bits
+    :param digest: Digest bytes (truncated to bit_length)
+    :return: Tuple of (unit, explanation, raw bytes)
+    """
+    digest = digest[: bit_length // 8]
+    header = ic.encode_header(mtype, stype, version, ic.encode_length(mtype, bit_length))
+    unit = ic.encode_base32(header + digest)
+    if mtype == ic.MT.ID:
+        explanation = explain_unit(unit)
+    else:
+        explanation = explain_fields(mtype, stype, version, bit_length, digest)
+    return unit, explanation, header + digest
+
+
+def decompose_and_explain(iscc_code):
+    # type: (str) -> tuple[str, list[tuple[str, str, bytes]]]
+    """
+    Decompose and explain an ISCC-CODE in a single pass over its decoded bytes.
+
+    Equivalent to `iscc_explain` on the code plus `iscc_decompose` and `iscc_explain`
+    on every unit, but each header is parsed only once.
+
+    :param iscc_code: ISCC-CODE or sequence of ISCC-UNITs
+    :return: Tuple of (code explanation, list of (unit, explanation, raw bytes))
+    """
+    raw_code = ic.decode_base32(ic.normalize_multiformat(iscc_code))
+    explanation = None
+    units = []
+    while raw_code:
+        mt, st, vs, ln, body = ic.decode_header(raw_code)
+
+        # Standard ISCC-UNIT with tail continuation
+        if mt != ic.MT.ISCC:
+            ln_bits = ic.decode_length(mt, ln)
+            if explanation is None:
+                if mt == ic.MT.ID or len(body) != ln_bits // 8:
+                    # ISCC-IDs and unit sequences are explained (or rejected) by iscc-core
+                    explanation = explain_unit(iscc_code)
+                else:
+                    explanation = explain_fields(mt, st, vs, ln_bits, body)
+            units.append(build_unit(mt, st, vs, ln_bits, body))
+            raw_code = body[ln_bits // 8 :]
+            continue
+
+        # ISCC-CODE
+        main_types = ic.decode_units(ln)
+        if explanation is None:
+            composition = "".join(t.name[0] for t in main_types) + "DI"
+            explanation = explain_fields(mt, st, vs, composition, body)
+
+        # Special case for WIDE subtype (128-bit Data + 128-bit Instance)
+        if st == ic.ST_ISCC.WIDE:
+            units.append(build_unit(ic.MT.DATA, ic.ST.NONE, vs, 128, body[:16]))
+            units.append(build_unit(ic.MT.INSTANCE, ic.ST.NONE, vs, 128, body[16:32]))
+            break
+
+        # Dynamic units (META, SEMANTIC, CONTENT) followed by static units (DATA, INSTANCE)
+        for idx, mtype in enumerate(main_types):
+            stype = ic.ST.NONE if mtype == ic.MT.META else st
+            units.append(build_unit(mtype, stype, vs, 64, body[idx * 8 :]))
+        units.append(build_unit(ic.MT.DATA, ic.ST.NONE, vs, 64, body[-16:-8]))
+        units.append(build_unit(ic.MT.INSTANCE, ic.ST.NONE, vs, 64, body[-8:]))
+        break
+
+    return explanation, units
+
 
 def inspect_iscc(iscc_code, show_binary=False, show_hex=False):
     # type: (str, bool, bool) -> dict
@@ -34,32 +153,23 @@ def inspect_iscc(iscc_code, show_binary=False, show_hex=False):
     :return: Dictionary containing inspection results
     """
     try:
-        # Decompose ISCC into individual units
-        units = ic.iscc_decompose(iscc_code)
-
-        # Get human-readable explanation
-        explanation = ic.iscc_explain(iscc_code)
+        # Decompose ISCC into individual units and explain them in one pass
+        explanation, units = decompose_and_explain(iscc_code)
 
         # Collect detailed information for each unit
         unit_details = []
-        for unit in units:
-            try:
-                unit_info = {"iscc": unit, "explanation": ic.iscc_explain(unit)}
+        for unit, unit_explanation, decoded in units:
+            unit_info = {"iscc": unit, "explanation": unit_explanation}
 
-                # Add binary representation if requested
-                if show_binary:
-                    # Decode to get binary digest
-                    decoded = ic.decode(unit)
-                    unit_info["binary"] = bin(int.from_bytes(decoded, byteorder="big"))
+            # Add binary representation if requested
+            if show_binary:
+                unit_info["binary"] = format_binary(decoded)
 
-                # Add hex representation if requested
-                if show_hex:
-                    decoded = ic.decode(unit)
-                    unit_info["hex"] = decoded.hex()
+            # Add hex representation if requested
+            if show_hex:
+                unit_info["hex"] = decoded.hex()
 
-                unit_details.append(unit_info)
-            except Exception as e:
-                unit_details.append({"iscc": unit, "error": str(e)})
+            unit_details.append(unit_info)
 
         result = {
             "iscc_code": iscc_code,
@@ -162,7 +272,7 @@ Examples:
     if args.pretty:
         print(format_pretty(result))
     else:
-        print(json.dumps(result, indent=2))
+        print(format_output(result, pretty=True))
 
     # Exit with error code if inspection failed
     if "error" in result:
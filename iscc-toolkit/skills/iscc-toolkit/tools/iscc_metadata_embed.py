@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-sdk>=0.7.0"]
+# dependencies = ["iscc-sdk>=0.7.0", "orjson>=3.9"]
 # ///
 """
 ISCC Metadata Embedding Tool
@@ -12,10 +12,14 @@ Metadata can be provided as a JSON file or via stdin.
 
 import argparse
 import json
+import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import iscc_sdk as idk
+from iscc_utils import format_output, load_json
 
 
 def read_metadata(metadata_source):
@@ -32,8 +36,7 @@ def read_metadata(metadata_source):
     if metadata_source == "-":
         # Read from stdin
         try:
-            data = sys.stdin.read()
-            return json.loads(data)
+            return load_json(sys.stdin.buffer.read())
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON from stdin: {e}") from e
     else:
@@ -43,8 +46,7 @@ def read_metadata(metadata_source):
             raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
 
         try:
-            with metadata_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_json(metadata_path.read_bytes())
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {metadata_path}: {e}") from e
 
@@ -85,21 +87,80 @@ def embed_metadata(file_path, metadata, output_path):
         raise RuntimeError(f"Failed to embed metadata: {e}") from e
 
 
-def format_output(data, pretty):
-    # type: (dict, bool) -> str
+def read_jobs(source):
+    # type: (str) -> list[tuple[Path, str, Path | None]]
     """
-    Format output as JSON.
+    Read embedding jobs from a tab-separated file or stdin.
+
+    Each line holds a media file path and a metadata JSON file path, optionally
+    followed by an output path, separated by tabs.
 
     Args:
-        data: Data to format
-        pretty: Use human-readable formatting
+        source: Path to jobs file or '-' for stdin
 
     Returns:
-        JSON string
+        List of (file, metadata file, output path) tuples
+    """
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).read_text(encoding="utf-8").splitlines()
+
+    jobs = []
+    for line in lines:
+        if not line.strip():
+            continue
+        fields = line.split("\t")
+        if len(fields) not in (2, 3):
+            raise ValueError(f"Expected 'FILE<TAB>METADATA[<TAB>OUTPUT]' per line, got: {line!r}")
+        output_path = Path(fields[2]) if len(fields) == 3 else None
+        jobs.append((Path(fields[0]), fields[1], output_path))
+    return jobs
+
+
+def embed_many(jobs, workers=None):
+    # type: (list[tuple[Path, str, Path | None]], int | None) -> Iterator[dict]
     """
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    Embed metadata into multiple files concurrently.
+
+    Metadata files shared by several jobs are parsed only once. Results are yielded
+    in input order.
+
+    Args:
+        jobs: List of (file, metadata file, output path) tuples
+        workers: Number of worker threads (default: number of CPUs)
+
+    Returns:
+        Iterator over result dictionaries (with "error" key on failure)
+    """
+    metadata_cache = {}
+    for _, metadata_source, _ in jobs:
+        if metadata_source not in metadata_cache:
+            try:
+                metadata_cache[metadata_source] = read_metadata(metadata_source)
+            except (OSError, ValueError) as e:
+                metadata_cache[metadata_source] = e
+
+    def embed_job(job):
+        # type: (tuple[Path, str, Path | None]) -> dict
+        file_path, metadata_source, output_path = job
+        try:
+            metadata = metadata_cache[metadata_source]
+            if isinstance(metadata, Exception):
+                raise metadata
+            input_path = file_path.resolve(strict=True)
+            target_path = embed_metadata(input_path, metadata, output_path)
+            return {
+                "status": "success",
+                "input_file": str(input_path),
+                "output_file": os.path.abspath(target_path),
+                "metadata_embedded": True,
+            }
+        except Exception as e:
+            return {"status": "error", "input_file": str(file_path), "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        yield from executor.map(embed_job, jobs)
 
 
 def main():
@@ -114,6 +175,11 @@ Examples:
   %(prog)s --file image.jpg --metadata metadata.json
   %(prog)s --file audio.mp3 --metadata - < metadata.json
   %(prog)s -f doc.pdf -m meta.json -o /path/to/output.pdf
+  %(prog)s --files-from jobs.tsv --workers 8
+
+Jobs file format (tab-separated, one file per line, results as JSON lines):
+  image1.jpg<TAB>meta1.json
+  image2.jpg<TAB>meta2.json<TAB>out/image2.jpg
 
 Supported formats:
   - PDF (.pdf)
@@ -127,14 +193,11 @@ Supported formats:
     parser.add_argument(
         "--file",
         "-f",
-        required=True,
         type=Path,
         help="Media file to embed metadata into",
     )
 
-    parser.add_argument(
-        "--metadata", "-m", required=True, help="JSON metadata file or '-' for stdin"
-    )
+    parser.add_argument("--metadata", "-m", help="JSON metadata file or '-' for stdin")
 
     parser.add_argument(
         "--output",
@@ -143,17 +206,47 @@ Supported formats:
         help="Output file path (default: overwrite input file)",
     )
 
+    parser.add_argument(
+        "--files-from",
+        metavar="FILE",
+        help="Tab-separated jobs file (FILE, METADATA[, OUTPUT]) or '-' for stdin",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of parallel workers for --files-from (default: number of CPUs)",
+    )
+
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
 
     args = parser.parse_args()
 
+    if args.files_from:
+        try:
+            jobs = read_jobs(args.files_from)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        failed = False
+        for result in embed_many(jobs, args.workers):
+            failed = failed or "error" in result
+            print(format_output(result, args.pretty), flush=True)
+        return 1 if failed else 0
+
+    if args.file is None or args.metadata is None:
+        parser.error("--file and --metadata are required (or use --files-from)")
+
     try:
-        # Validate input file exists
-        if not args.file.exists():
+        # Validate input file exists (resolved once and reused for the output paths)
+        try:
+            input_path = args.file.resolve(strict=True)
+        except FileNotFoundError:
             print(f"Error: Input file not found: {args.file}", file=sys.stderr)
             return 1
 
-        if not args.file.is_file():
+        if not stat.S_ISREG(os.stat(input_path).st_mode):
             print(f"Error: Not a regular file: {args.file}", file=sys.stderr)
             return 1
 
@@ -166,7 +259,7 @@ Supported formats:
 
         # Embed metadata
         try:
-            output_path = embed_metadata(args.file, metadata, args.output)
+            output_path = embed_metadata(input_path, metadata, args.output)
         except RuntimeError as e:
             print(f"Error: {e}", file=sys.stderr)
             return 1
@@ -174,8 +267,8 @@ Supported formats:
         # Output success result
         result = {
             "status": "success",
-            "input_file": str(args.file.resolve()),
-            "output_file": str(output_path.resolve()),
+            "input_file": str(input_path),
+            "output_file": os.path.abspath(output_path),
             "metadata_embedded": True,
         }
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-sdk>=0.7.0"]
+# dependencies = ["iscc-sdk>=0.7.0", "orjson>=3.9"]
 # ///
 """
 ISCC Metadata Extraction Tool
@@ -11,11 +11,17 @@ Outputs structured metadata in JSON format.
 """
 
 import argparse
-import json
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import iscc_sdk as idk
+from iscc_utils import format_output
+
+# Default number of files processed concurrently (extraction mostly waits on file I/O
+# and external tools, so threads overlap well beyond the CPU count)
+DEFAULT_WORKERS = 8
 
 
 def extract_metadata(file_path):
@@ -48,26 +54,67 @@ def extract_metadata(file_path):
         return {"raw": str(metadata)}
 
 
-def format_output(data, pretty):
-    # type: (dict | list, bool) -> str
+def extract_one(file_path):
+    # type: (Path) -> dict
     """
-    Format output as JSON.
+    Extract metadata for one file, capturing errors in the result.
 
     Args:
-        data: Data to format
-        pretty: Use human-readable formatting
+        file_path: Path to the media file
 
     Returns:
-        JSON string
+        Dictionary with resolved file path and metadata, or file path and error message
     """
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False, default=str)
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+    # Validate file exists and is a regular file with a single stat call
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return {"file": str(file_path), "error": "File not found"}
 
+    if not stat.S_ISREG(st.st_mode):
+        return {"file": str(file_path), "error": "Not a regular file"}
+
+    try:
+        return {"file": str(file_path.resolve()), "metadata": extract_metadata(file_path)}
+    except Exception as e:
+        return {"file": str(file_path), "error": str(e)}
+
+
+def extract_many(file_paths, workers=DEFAULT_WORKERS):
+    # type: (list[Path], int) -> Iterator[dict]
+    """
+    Extract metadata for multiple files, overlapping their I/O in worker threads.
+
+    Args:
+        file_paths: Paths to media files
+        workers: Number of worker threads
+
+    Returns:
+        Iterator over results in input order (see extract_one)
+    """
+    if workers <= 1 or len(file_paths) <= 1:
+        yield from map(extract_one, file_paths)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+        yield from executor.map(extract_one, file_paths)
+
+
+def parse_args():
+    # type: () -> argparse.Namespace
+    """
+    Parse command line arguments.
+
+    A single file argument without options skips building the argument parser.
+
+    Returns:
+        Parsed arguments
+    """
+    if len(sys.argv) == 2:
+        arg = sys.argv[1]
+        if not arg.startswith("-"):
+            return argparse.Namespace(files=[Path(arg)], pretty=False, workers=1)
 
-def main():
-    # type: () -> int
-    """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Extract metadata from media files for ISCC generation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -77,6 +124,7 @@ Examples:
   %(prog)s --pretty image.jpg
   %(prog)s file1.mp3 file2.mp3 file3.mp3
   %(prog)s *.jpg > metadata.json
+  %(prog)s --workers 16 media/*
         """,
     )
 
@@ -86,28 +134,30 @@ Examples:
 
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of files processed concurrently (default: {DEFAULT_WORKERS})",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    # type: () -> int
+    """Main entry point."""
+    args = parse_args()
 
     try:
         results = []
         errors = []
 
-        for file_path in args.files:
-            # Validate file exists
-            if not file_path.exists():
-                errors.append({"file": str(file_path), "error": "File not found"})
-                continue
-
-            if not file_path.is_file():
-                errors.append({"file": str(file_path), "error": "Not a regular file"})
-                continue
-
-            try:
-                metadata = extract_metadata(file_path)
-                result = {"file": str(file_path.resolve()), "metadata": metadata}
+        for result in extract_many(args.files, args.workers):
+            if "error" in result:
+                errors.append(result)
+            else:
                 results.append(result)
-            except Exception as e:
-                errors.append({"file": str(file_path), "error": str(e)})
 
         # Prepare output
         if len(args.files) == 1 and results:
@@ -119,7 +169,7 @@ Examples:
             if errors:
                 output["errors"] = errors
 
-        print(format_output(output, args.pretty))
+        print(format_output(output, args.pretty, default=str))
 
         # Return non-zero if any errors occurred
         return 1 if errors else 0
@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-core>=1.0.0"]
+# dependencies = ["iscc-core>=1.0.0", "numpy>=1.24", "orjson>=3.9"]
 # ///
 """Normalize text using ISCC text processing pipeline.
 
@@ -10,19 +10,216 @@ with options to display n-grams and character statistics.
 """
 
 import argparse
-import json
+import hashlib
 import sys
+import unicodedata
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
 
 try:
     import iscc_core as ic
+    import numpy as np
 except ImportError:
     print(
-        "Error: iscc-core is not installed. Install with: pip install iscc-core",
+        "Error: iscc-core and numpy are required. Install with: pip install iscc-core numpy",
         file=sys.stderr,
     )
     sys.exit(1)
 
+from iscc_utils import format_output, open_bytes
+
+# Character classes for ASCII codepoints (non-ASCII characters are classified individually)
+ASCII_WHITESPACE = np.array([chr(i).isspace() for i in range(128)])
+ASCII_ALNUM = np.array([chr(i).isalnum() for i in range(128)])
+
+
+def read_text(input_path):
+    # type: (Path) -> str
+    """
+    Read a UTF-8 text file with universal newlines, memory-mapping large files.
+
+    :param input_path: Path to text file
+    :return: File content with line endings translated to newlines
+    """
+    with open_bytes(input_path) as data:
+        text = str(data, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# ASCII characters removed by text_collapse (whitespace and filtered Unicode categories).
+# NFD/NFKC normalization is a no-op for ASCII, so collapsing reduces to lower + delete.
+ASCII_COLLAPSE_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(
+        chr(i)
+        for i in range(128)
+        if chr(i).isspace() or unicodedata.category(chr(i))[0] in ic.core_opts.text_unicode_filter
+    ),
+)
+
+
+def collapse_text(text):
+    # type: (str) -> str
+    """
+    Apply `ic.text_collapse` with a fast path for pure ASCII input.
+
+    :param text: Input text
+    :return: Collapsed text (identical to `ic.text_collapse`)
+    """
+    if text.isascii():
+        return text.lower().translate(ASCII_COLLAPSE_TABLE)
+    return ic.text_collapse(text)
+
+
+# Recently normalized texts keyed on (blake2b digest of text, collapse), least recent first
+NORMALIZE_CACHE = OrderedDict()  # type: OrderedDict[tuple[bytes, bool], str]
+NORMALIZE_CACHE_SIZE = 1024
+
+
+def normalize_cached(text, collapse):
+    # type: (str, bool) -> str
+    """
+    Normalize text, reusing results for texts that were normalized before.
+
+    Texts are keyed on a fixed-size digest so large inputs are not retained as keys.
+
+    :param text: Input text
+    :param collapse: Use text_collapse instead of text_normalize
+    :return: Normalized text
+    """
+    key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), collapse)
+    if key in NORMALIZE_CACHE:
+        NORMALIZE_CACHE.move_to_end(key)
+        return NORMALIZE_CACHE[key]
+
+    normalized = collapse_text(text) if collapse else ic.text_normalize(text)
+    NORMALIZE_CACHE[key] = normalized
+    if len(NORMALIZE_CACHE) > NORMALIZE_CACHE_SIZE:
+        NORMALIZE_CACHE.popitem(last=False)
+    return normalized
+
+
+def iter_ngrams(text, size):
+    # type: (str, int) -> Iterator[str]
+    """
+    Lazily yield character n-grams of a text.
+
+    :param text: Input text
+    :param size: Number of characters per n-gram
+    :return: Iterator over n-grams
+    """
+    for i in range(len(text) - size + 1):
+        yield text[i : i + size]
+
+
+def ngram_offsets(text, size):
+    # type: (str, int) -> np.ndarray
+    """
+    Get start offsets of all character n-grams of a text.
+
+    The n-gram at offset ``i`` is ``text[i : i + size]``; slices are only materialized
+    on demand instead of allocating one string object per n-gram.
+
+    :param text: Input text
+    :param size: Number of characters per n-gram
+    :return: int32 array of n-gram start offsets
+    """
+    return np.arange(max(0, len(text) - size + 1), dtype=np.int32)
+
+
+def ngram_windows(text, size):
+    # type: (str, int) -> np.ndarray
+    """
+    Get all character n-grams of a text as a read-only matrix of codepoints.
+
+    Each row is a zero-copy window over one shared uint32 codepoint buffer, suitable
+    for vectorized hashing of n-gram features.
+
+    :param text: Input text
+    :param size: Number of characters per n-gram
+    :return: uint32 array of shape (n-gram count, size)
+    """
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    if codes.size < size:
+        return np.empty((0, size), dtype=np.uint32)
+    return np.lib.stride_tricks.sliding_window_view(codes, size)
+
+
+# Odd multiplier of the polynomial n-gram hash (arithmetic wraps modulo 2**64)
+NGRAM_HASH_BASE = np.uint64(0x100000001B3)
+
+
+def ngram_hashes(text, size):
+    # type: (str, int) -> np.ndarray
+    """
+    Hash all character n-grams of a text without materializing n-gram strings.
+
+    Each n-gram ``c[0] .. c[size-1]`` hashes to ``sum(c[k] * B**(size-1-k))`` modulo
+    2**64, computed for all windows with a single matrix-vector product.
+
+    :param text: Input text
+    :param size: Number of characters per n-gram
+    :return: uint64 array with one hash per n-gram
+    """
+    powers = np.full(size, NGRAM_HASH_BASE, dtype=np.uint64)
+    powers[0] = 1
+    powers = np.cumprod(powers)[::-1]
+    return ngram_windows(text, size).astype(np.uint64) @ powers
+
+
+def char_stats(text):
+    # type: (str) -> dict
+    """
+    Calculate character and byte statistics for a text.
+
+    The text is reduced to its distinct codepoints and their frequencies in a single
+    pass (a byte histogram for ASCII text). Character classes are then looked up per
+    distinct codepoint (vectorized for ASCII) and weighted by frequency. The UTF-8 byte
+    length is derived from the same histogram instead of encoding the text again.
+
+    :param text: Text to analyze
+    :return: Dictionary with character, byte and character class counts
+    """
+    if text.isascii():
+        # Linear-time histogram over byte values instead of sorting all codepoints
+        histogram = np.bincount(np.frombuffer(text.encode("ascii"), dtype=np.uint8))
+        values = np.flatnonzero(histogram).astype(np.uint32)
+        counts = histogram[values]
+        n_bytes = len(text)
+    else:
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        values, counts = np.unique(codes, return_counts=True)
+        utf8_widths = 1 + (values >= 0x80) + (values >= 0x800) + (values >= 0x10000)
+        n_bytes = int(np.dot(counts, utf8_widths))
+
+    ascii_mask = values < 128
+    ascii_values = values[ascii_mask]
+    ascii_counts = counts[ascii_mask]
+    whitespace = int(ascii_counts[ASCII_WHITESPACE[ascii_values]].sum())
+    alnum = int(ascii_counts[ASCII_ALNUM[ascii_values]].sum())
+
+    for codepoint, count in zip(
+        values[~ascii_mask].tolist(), counts[~ascii_mask].tolist(), strict=True
+    ):
+        char = chr(codepoint)
+        if char.isspace():
+            whitespace += count
+        elif char.isalnum():
+            alnum += count
+
+    return {
+        "characters": len(text),
+        "bytes": n_bytes,
+        "unique_chars": int(values.size),
+        "whitespace_count": whitespace,
+        "alphanumeric_count": alnum,
+        "punctuation_count": len(text) - whitespace - alnum,
+    }
+
 
 def normalize_text(text, collapse=False, show_ngrams=False, show_stats=False):
     # type: (str, bool, bool, bool) -> dict
@@ -37,12 +234,8 @@ def normalize_text(text, collapse=False, show_ngrams=False, show_stats=False):
     """
     try:
         # Apply normalization
-        if collapse:
-            normalized = ic.text_collapse(text)
-            operation = "text_collapse"
-        else:
-            normalized = ic.text_normalize(text)
-            operation = "text_normalize"
+        normalized = normalize_cached(text, collapse)
+        operation = "text_collapse" if collapse else "text_normalize"
 
         result = {
             "operation": operation,
@@ -58,45 +251,20 @@ def normalize_text(text, collapse=False, show_ngrams=False, show_stats=False):
 
         # Add statistics if requested
         if show_stats:
-            original_bytes = text.encode("utf-8")
-            normalized_bytes = normalized.encode("utf-8")
-
             stats = {
-                "original": {
-                    "characters": len(text),
-                    "bytes": len(original_bytes),
-                    "unique_chars": len(set(text)),
-                    "whitespace_count": sum(1 for c in text if c.isspace()),
-                    "alphanumeric_count": sum(1 for c in text if c.isalnum()),
-                    "punctuation_count": sum(
-                        1 for c in text if not c.isalnum() and not c.isspace()
-                    ),
-                },
-                "normalized": {
-                    "characters": len(normalized),
-                    "bytes": len(normalized_bytes),
-                    "unique_chars": len(set(normalized)),
-                    "whitespace_count": sum(1 for c in normalized if c.isspace()),
-                    "alphanumeric_count": sum(1 for c in normalized if c.isalnum()),
-                    "punctuation_count": sum(
-                        1 for c in normalized if not c.isalnum() and not c.isspace()
-                    ),
-                },
+                "original": char_stats(text),
+                "normalized": char_stats(normalized),
             }
             result["statistics"] = stats
 
         # Add n-grams if requested
         if show_ngrams:
-            ngrams = []
             ngram_size = 13
-            for i in range(len(normalized) - ngram_size + 1):
-                ngram = normalized[i : i + ngram_size]
-                ngrams.append(ngram)
-
+            count = max(0, len(normalized) - ngram_size + 1)
             result["ngrams"] = {
                 "size": ngram_size,
-                "count": len(ngrams),
-                "samples": ngrams[:10],  # Show first 10 n-grams as samples
+                "count": count,
+                "samples": list(islice(iter_ngrams(normalized, ngram_size), 10)),  # First 10
             }
 
         return result
@@ -122,8 +290,7 @@ def normalize_from_file(input_path, output_path, collapse, show_ngrams, show_sta
     """
     try:
         # Read input file
-        with open(input_path, encoding="utf-8") as f:
-            text = f.read()
+        text = read_text(input_path)
 
         # Normalize
         result = normalize_text(text, collapse, show_ngrams, show_stats)
@@ -300,7 +467,7 @@ The collapse operation additionally:
     if args.pretty:
         print(format_pretty(result))
     else:
-        print(json.dumps(result, indent=2))
+        print(format_output(result, pretty=True))
 
     # Exit with error code if normalization failed
     if "error" in result:
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["httpx>=0.27.0"]
+# dependencies = ["httpx[http2]>=0.27.0", "orjson>=3.9"]
 # ///
 """
 ISCC Search Tool
@@ -11,15 +11,31 @@ Supports exact lookup and semantic text similarity search.
 """
 
 import argparse
-import asyncio
-import json
+import functools
+import re
 import sys
 
 import httpx
+from iscc_utils import format_output
 
 DEFAULT_INDEX_URL = "https://sb0.iscc.id"
 PRODUCTION_INDEX_URL = "https://index.iscc.id"
 
+# Hex digits (any case) of an ISCC-ID after the ISCC prefix and with dashes removed
+HEX_PATTERN = re.compile(r"[0-9A-Fa-f]*")
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    # type: () -> httpx.Client
+    """
+    Get the shared HTTP/2 client (created on first use).
+
+    Returns:
+        Pooled synchronous HTTP client
+    """
+    return httpx.Client(http2=True, timeout=30.0, limits=httpx.Limits(max_keepalive_connections=4))
+
 
 def detect_query_type(query):
     # type: (str) -> str
@@ -42,14 +58,14 @@ def detect_query_type(query):
     if query_upper.startswith("ISCC") and len(query) >= 16:
         # Simple heuristic: if mostly hex chars after ISCC prefix
         hex_part = query[4:].replace("-", "")
-        if all(c in "0123456789ABCDEF" for c in hex_part.upper()):
+        if HEX_PATTERN.fullmatch(hex_part):
             return "id"
 
     # Default to text search
     return "text"
 
 
-async def lookup_exact(query, index_url, query_type):
+def lookup_exact(query, index_url, query_type):
     # type: (str, str, str) -> dict
     """
     Perform exact lookup by ISCC code or ISCC-ID.
@@ -65,26 +81,25 @@ async def lookup_exact(query, index_url, query_type):
     # Construct lookup URL
     lookup_url = f"{index_url}/lookup/{query}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    try:
+        response = get_client().get(lookup_url)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return {"results": [], "message": "No matches found"}
+        # Try to extract error message
         try:
-            response = await client.get(lookup_url)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return {"results": [], "message": "No matches found"}
-            # Try to extract error message
-            try:
-                error_data = e.response.json()
-                error_msg = error_data.get("detail", str(e))
-            except Exception:
-                error_msg = str(e)
-            raise RuntimeError(f"API error: {error_msg}") from e
-        except httpx.RequestError as e:
-            raise RuntimeError(f"Request failed: {e}") from e
-
-
-async def search_text(query, index_url, limit, threshold):
+            error_data = e.response.json()
+            error_msg = error_data.get("detail", str(e))
+        except Exception:
+            error_msg = str(e)
+        raise RuntimeError(f"API error: {error_msg}") from e
+    except httpx.RequestError as e:
+        raise RuntimeError(f"Request failed: {e}") from e
+
+
+def search_text(query, index_url, limit, threshold):
     # type: (str, str, int, Optional[float]) -> dict
     """
     Perform semantic text search.
@@ -109,24 +124,23 @@ async def search_text(query, index_url, limit, threshold):
     if threshold is not None:
         request_body["threshold"] = threshold
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    try:
+        response = get_client().post(search_url, json=request_body)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        # Try to extract error message
         try:
-            response = await client.post(search_url, json=request_body)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            # Try to extract error message
-            try:
-                error_data = e.response.json()
-                error_msg = error_data.get("detail", str(e))
-            except Exception:
-                error_msg = str(e)
-            raise RuntimeError(f"API error: {error_msg}") from e
-        except httpx.RequestError as e:
-            raise RuntimeError(f"Request failed: {e}") from e
-
-
-async def search_iscc(query, index_url, limit, threshold, query_type):
+            error_data = e.response.json()
+            error_msg = error_data.get("detail", str(e))
+        except Exception:
+            error_msg = str(e)
+        raise RuntimeError(f"API error: {error_msg}") from e
+    except httpx.RequestError as e:
+        raise RuntimeError(f"Request failed: {e}") from e
+
+
+def search_iscc(query, index_url, limit, threshold, query_type):
     # type: (str, str, int, Optional[float], Optional[str]) -> dict
     """
     Search ISCC registry.
@@ -147,30 +161,13 @@ async def search_iscc(query, index_url, limit, threshold, query_type):
 
     # Route to appropriate search method
     if query_type in ("code", "id"):
-        return await lookup_exact(query, index_url, query_type)
+        return lookup_exact(query, index_url, query_type)
     elif query_type == "text":
-        return await search_text(query, index_url, limit, threshold)
+        return search_text(query, index_url, limit, threshold)
     else:
         raise ValueError(f"Invalid query type: {query_type}")
 
 
-def format_output(data, pretty):
-    # type: (dict, bool) -> str
-    """
-    Format output as JSON.
-
-    Args:
-        data: Data to format
-        pretty: Use human-readable formatting
-
-    Returns:
-        JSON string
-    """
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
-
-
 def main():
     # type: () -> int
     """Main entry point."""
@@ -196,6 +193,9 @@ Examples:
 
   # Limit results and set threshold
   %(prog)s --limit 5 --threshold 85 "machine learning algorithms"
+
+  # Stream one result per line into jq
+  %(prog)s --ndjson "machine learning algorithms" | head -n 3
         """,
     )
 
@@ -221,7 +221,15 @@ Examples:
         help="Force specific query type (default: auto-detect)",
     )
 
-    parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
+    output_format = parser.add_mutually_exclusive_group()
+
+    output_format.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
+
+    output_format.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write each result as a single JSON line",
+    )
 
     args = parser.parse_args()
 
@@ -232,13 +240,14 @@ Examples:
             return 1
 
     try:
-        # Run async search
-        result = asyncio.run(
-            search_iscc(args.query, args.index, args.limit, args.threshold, args.type)
-        )
+        result = search_iscc(args.query, args.index, args.limit, args.threshold, args.type)
 
         # Output result
-        print(format_output(result, args.pretty))
+        if args.ndjson:
+            for hit in result.get("results", []):
+                print(format_output(hit), flush=True)
+        else:
+            print(format_output(result, args.pretty))
         return 0
 
     except Exception as e:
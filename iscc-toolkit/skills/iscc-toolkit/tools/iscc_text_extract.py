@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-sdk>=0.7.0"]
+# dependencies = ["iscc-sdk>=0.7.0", "orjson>=3.9"]
 # ///
 """
 ISCC Text Extraction Tool
@@ -11,11 +11,55 @@ ISCC-specific normalization. Outputs text for further processing or storage.
 """
 
 import argparse
-import json
+import re
+import stat
 import sys
 from pathlib import Path
 
+import iscc_core as ic
 import iscc_sdk as idk
+import iscc_utils
+
+
+def read_text(file_path):
+    # type: (Path) -> str
+    """
+    Extract plaintext from a media file.
+
+    Args:
+        file_path: Path to media file
+
+    Returns:
+        Extracted plaintext
+    """
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Not a file: {file_path}")
+
+    return idk.text_extract(str(file_path))
+
+
+def normalization_name(normalize, collapse):
+    # type: (bool, bool) -> str
+    """
+    Name the normalization applied for the given options.
+
+    Args:
+        normalize: text_clean is applied
+        collapse: text_collapse is applied
+
+    Returns:
+        Name of the last normalization step ("none" if no normalization)
+    """
+    if collapse:
+        return "text_collapse"
+    if normalize:
+        return "text_clean"
+    return "none"
 
 
 def extract_text(file_path, normalize, collapse):
@@ -31,43 +75,122 @@ def extract_text(file_path, normalize, collapse):
     Returns:
         Tuple of (extracted_text, stats_dict)
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    if not file_path.is_file():
-        raise ValueError(f"Not a file: {file_path}")
-
     # Extract plaintext from media file
-    text = idk.text_extract(str(file_path))
+    text = read_text(file_path)
     original_length = len(text)
 
     # Apply normalization
-    normalization = "none"
-
     if normalize:
         # Same normalization as iscc-sdk applies before ic.gen_text_code_v0()
-        import iscc_core as ic
-
         text = ic.text_clean(text)
-        normalization = "text_clean"
 
     if collapse:
         # Aggressive normalization used internally by ic.gen_text_code_v0()
-        import iscc_core as ic
-
         text = ic.text_collapse(text)
-        normalization = "text_collapse"
 
     stats = {
         "file": str(file_path.resolve()),
         "original_chars": original_length,
         "output_chars": len(text),
-        "normalization": normalization,
+        "normalization": normalization_name(normalize, collapse),
     }
 
     return text, stats
 
 
+# Approximate size in characters of the chunks normalized at a time when writing to a file
+CHUNK_SIZE = 1 << 20
+
+# Line breaks between ASCII alphanumerics. text_clean and text_collapse give the same
+# result chunk by chunk as on the whole text when it is split at these points only.
+SPLIT_POINT = re.compile(r"(?<=[0-9A-Za-z])\n(?=[0-9A-Za-z])")
+
+
+def iter_chunks(text, size=CHUNK_SIZE):
+    # type: (str, int) -> Iterator[str]
+    """
+    Split text into chunks of at least `size` characters at safe line breaks.
+
+    The line break at each split point is dropped. Text without split points
+    (e.g. without ASCII line endings) is yielded as a single chunk.
+
+    Args:
+        text: Text to split
+        size: Minimum chunk size in characters
+
+    Returns:
+        Iterator over text chunks
+    """
+    start = 0
+    while True:
+        match = SPLIT_POINT.search(text, start + size)
+        if match is None:
+            yield text[start:]
+            return
+        yield text[start : match.start()]
+        start = match.end()
+
+
+def iter_normalized(text, normalize, collapse):
+    # type: (str, bool, bool) -> Iterator[str]
+    """
+    Normalize text chunk by chunk, yielding pieces of the normalized text.
+
+    The joined pieces are identical to normalizing the whole text at once,
+    without holding a second full copy in memory.
+
+    Args:
+        text: Text to normalize
+        normalize: Apply iscc_core.text_clean
+        collapse: Apply iscc_core.text_collapse
+
+    Returns:
+        Iterator over normalized text pieces
+    """
+    for i, chunk in enumerate(iter_chunks(text)):
+        if normalize:
+            chunk = ic.text_clean(chunk)
+        if collapse:
+            chunk = ic.text_collapse(chunk)
+        elif i:
+            # Restore the line break dropped at the split point
+            yield "\n"
+        yield chunk
+
+
+def extract_to_file(file_path, output, normalize, collapse):
+    # type: (Path, Path, bool, bool) -> dict
+    """
+    Extract and optionally normalize text from a media file, streaming it to a file.
+
+    Args:
+        file_path: Path to media file
+        output: Path to output text file
+        normalize: Apply iscc_core.text_clean (same as iscc-sdk before gen_text_code)
+        collapse: Apply iscc_core.text_collapse (aggressive: lowercase, no whitespace/punctuation)
+
+    Returns:
+        Stats dictionary (see extract_text) with output file path
+    """
+    text = read_text(file_path)
+    pieces = iter_normalized(text, normalize, collapse) if normalize or collapse else [text]
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output_chars = 0
+    with output.open("w", encoding="utf-8") as f:
+        for piece in pieces:
+            f.write(piece)
+            output_chars += len(piece)
+
+    return {
+        "file": str(file_path.resolve()),
+        "original_chars": len(text),
+        "output_chars": output_chars,
+        "normalization": normalization_name(normalize, collapse),
+        "output_file": str(output.resolve()),
+    }
+
+
 def format_output(text, stats, pretty, text_only):
     # type: (str, dict, bool, bool) -> str
     """
@@ -85,10 +208,7 @@ def format_output(text, stats, pretty, text_only):
     if text_only:
         return text
 
-    data = {**stats, "text": text}
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return iscc_utils.format_output({**stats, "text": text}, pretty)
 
 
 def main():
@@ -145,20 +265,14 @@ Examples:
     args = parser.parse_args()
 
     try:
-        text, stats = extract_text(args.file, args.normalize, args.collapse)
-
         # Write to file if output specified
         if args.output:
-            args.output.parent.mkdir(parents=True, exist_ok=True)
-            args.output.write_text(text, encoding="utf-8")
-            stats["output_file"] = str(args.output.resolve())
+            stats = extract_to_file(args.file, args.output, args.normalize, args.collapse)
             # Print stats only when writing to file
-            if args.pretty:
-                print(json.dumps(stats, indent=2, ensure_ascii=False))
-            else:
-                print(json.dumps(stats, separators=(",", ":"), ensure_ascii=False))
+            print(iscc_utils.format_output(stats, args.pretty))
         else:
             # Print to stdout
+            text, stats = extract_text(args.file, args.normalize, args.collapse)
             print(format_output(text, stats, args.pretty, args.text_only))
 
         return 0
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-sdk>=0.7.0"]
+# dependencies = ["iscc-sdk>=0.7.0", "orjson>=3.9"]
 # ///
 """
 ISCC Thumbnail Generator
@@ -12,16 +12,22 @@ to file. Supports configurable size, format, and quality.
 
 import argparse
 import base64
+import binascii
+import io
+import stat
 import sys
 from pathlib import Path
 
-import iscc_sdk as idk
+from iscc_utils import format_output, get_sdk, read_paths
 
+# Base64 characters decoded per write (multiple of 4 so chunks align with quads)
+DECODE_CHUNK_SIZE = 1 << 16
 
-def generate_thumbnail(file_path, size, img_format, quality):
-    # type: (Path, Optional[int], str, Optional[int]) -> str
+
+def render_thumbnail(file_path, size, img_format, quality):
+    # type: (Path, Optional[int], str, Optional[int]) -> Union[str, Image.Image]
     """
-    Generate thumbnail from media file.
+    Render thumbnail for media file with the SDK.
 
     Args:
         file_path: Path to media file
@@ -30,12 +36,14 @@ def generate_thumbnail(file_path, size, img_format, quality):
         quality: Quality for lossy formats (1-100)
 
     Returns:
-        Data URL (base64-encoded image)
+        Data URL or PIL image, depending on the SDK version
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Not a file: {file_path}")
 
     try:
@@ -50,14 +58,106 @@ def generate_thumbnail(file_path, size, img_format, quality):
 
         # Generate thumbnail
         fp_str = str(file_path)
-        data_url = idk.thumbnail(fp_str, **kwargs)
-
-        return data_url
+        return get_sdk().thumbnail(fp_str, **kwargs)
 
     except Exception as e:
         raise RuntimeError(f"Failed to generate thumbnail: {e}") from e
 
 
+def generate_thumbnail(file_path, size, img_format, quality):
+    # type: (Path, Optional[int], str, Optional[int]) -> str
+    """
+    Generate thumbnail from media file.
+
+    Args:
+        file_path: Path to media file
+        size: Maximum dimension in pixels
+        img_format: Output format (webp, jpeg, png)
+        quality: Quality for lossy formats (1-100)
+
+    Returns:
+        Data URL (base64-encoded image)
+    """
+    thumb = render_thumbnail(file_path, size, img_format, quality)
+    if isinstance(thumb, str):
+        return thumb
+    return image_to_data_url(thumb, img_format, quality)
+
+
+def image_to_data_url(img, img_format, quality):
+    # type: (Image.Image, str, Optional[int]) -> str
+    """
+    Encode a PIL image as a base64 data URL.
+
+    Args:
+        img: PIL image returned by the SDK
+        img_format: Output format (webp, jpeg, png)
+        quality: Quality for lossy formats (1-100)
+
+    Returns:
+        Data URL (base64-encoded image)
+    """
+    try:
+        raw = io.BytesIO()
+        kwargs = {} if quality is None else {"quality": quality}
+        img.save(raw, format=img_format.upper(), **kwargs)
+    except Exception as e:
+        raise RuntimeError(f"Failed to encode thumbnail: {e}") from e
+    encoded = base64.b64encode(raw.getbuffer()).decode("ascii")
+    return f"data:image/{img_format};base64,{encoded}"
+
+
+def write_thumbnail(file_path, output_path, size, img_format, quality):
+    # type: (Path, Path, Optional[int], str, Optional[int]) -> None
+    """
+    Generate thumbnail from media file and write it to an image file.
+
+    If the SDK returns an image object it is encoded straight into the output file,
+    skipping the base64 data URL round-trip.
+
+    Args:
+        file_path: Path to media file
+        output_path: Output file path
+        size: Maximum dimension in pixels
+        img_format: Output format (webp, jpeg, png)
+        quality: Quality for lossy formats (1-100)
+    """
+    thumb = render_thumbnail(file_path, size, img_format, quality)
+    if isinstance(thumb, str):
+        save_thumbnail_to_file(thumb, output_path)
+        return
+
+    try:
+        kwargs = {} if quality is None else {"quality": quality}
+        thumb.save(output_path, format=img_format.upper(), **kwargs)
+    except Exception as e:
+        raise RuntimeError(f"Failed to save thumbnail: {e}") from e
+
+
+def generate_many(file_paths, size, img_format, quality):
+    # type: (Iterable[Path], Optional[int], str, Optional[int]) -> Iterator[dict]
+    """
+    Generate thumbnails for multiple files within a single process.
+
+    Image decoders are initialized once and reused for all files.
+
+    Args:
+        file_paths: Paths to media files
+        size: Maximum dimension in pixels
+        img_format: Output format (webp, jpeg, png)
+        quality: Quality for lossy formats (1-100)
+
+    Returns:
+        Iterator over dictionaries with file path and data URL or error message
+    """
+    for file_path in file_paths:
+        try:
+            data_url = generate_thumbnail(file_path, size, img_format, quality)
+            yield {"file": str(file_path), "thumbnail": data_url}
+        except Exception as e:
+            yield {"file": str(file_path), "error": str(e)}
+
+
 def save_thumbnail_to_file(data_url, output_path):
     # type: (str, Path) -> None
     """
@@ -68,18 +168,15 @@ def save_thumbnail_to_file(data_url, output_path):
         output_path: Output file path
     """
     # Parse data URL: data:image/webp;base64,<data>
-    if not data_url.startswith("data:"):
+    comma = data_url.find(",")
+    if not data_url.startswith("data:") or comma == -1:
         raise ValueError("Invalid data URL format")
 
     try:
-        # Split header and data
-        header, data = data_url.split(",", 1)
-
-        # Decode base64
-        image_data = base64.b64decode(data)
-
-        # Write to file
-        output_path.write_bytes(image_data)
+        # Decode base64 payload in chunks straight into the output file
+        with output_path.open("wb") as f:
+            for start in range(comma + 1, len(data_url), DECODE_CHUNK_SIZE):
+                f.write(binascii.a2b_base64(data_url[start : start + DECODE_CHUNK_SIZE]))
 
     except Exception as e:
         raise RuntimeError(f"Failed to save thumbnail: {e}") from e
@@ -97,10 +194,20 @@ Examples:
   %(prog)s --size 256 --format jpeg video.mp4
   %(prog)s --output thumb.webp --quality 90 document.pdf
   %(prog)s --format png image.jpg > thumbnail_data_url.txt
+  %(prog)s --batch files.txt > thumbnails.jsonl
         """,
     )
 
-    parser.add_argument("file", type=Path, help="Media file to process")
+    source = parser.add_mutually_exclusive_group(required=True)
+
+    source.add_argument("file", type=Path, nargs="?", help="Media file to process")
+
+    source.add_argument(
+        "--batch",
+        type=Path,
+        metavar="FILE",
+        help="File with one path per line ('-' for stdin), writes JSON lines",
+    )
 
     parser.add_argument("--size", type=int, help="Maximum dimension in pixels (default: 128)")
 
@@ -135,17 +242,28 @@ Examples:
             print("Error: Size must be positive", file=sys.stderr)
             return 1
 
-    try:
-        # Generate thumbnail
-        data_url = generate_thumbnail(args.file, args.size, args.format, args.quality)
+    if args.batch:
+        if args.output:
+            parser.error("--output cannot be used with --batch")
+        try:
+            paths = read_paths(args.batch)
+            failed = False
+            for result in generate_many(paths, args.size, args.format, args.quality):
+                failed = failed or "error" in result
+                print(format_output(result), flush=True)
+            return 1 if failed else 0
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
 
-        # Output
+    try:
         if args.output:
-            # Save to file
-            save_thumbnail_to_file(data_url, args.output)
+            # Write image file directly
+            write_thumbnail(args.file, args.output, args.size, args.format, args.quality)
             print(f"Thumbnail saved to {args.output}", file=sys.stderr)
         else:
             # Print data URL
+            data_url = generate_thumbnail(args.file, args.size, args.format, args.quality)
             print(data_url)
 
         return 0
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-sdk[all]>=0.7.0"]
+# dependencies = ["iscc-sdk[all]>=0.7.0", "iscc-core>=1.0.0", "orjson>=3.9"]
 # ///
 """
 ISCC Unit Generator
@@ -11,11 +11,45 @@ and semantic codes for text and images.
 """
 
 import argparse
-import json
+import contextlib
+import functools
+import mmap
+import os
+import stat
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-import iscc_sdk as idk
+import iscc_core as ic
+from iscc_utils import MMAP_THRESHOLD, format_output, get_sdk, read_paths, to_dict
+
+
+@contextlib.contextmanager
+def open_stream(file_path):
+    # type: (Path) -> Iterator[BinaryIO]
+    """
+    Open a file for hashing, memory-mapped if it is larger than MMAP_THRESHOLD.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Context manager yielding a readable binary stream
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+# Unit types bound by file I/O that are hashed in parallel threads in batch mode, all
+# other (CPU-bound) unit types are distributed across worker processes
+THREADED_UNITS = frozenset({"data", "instance"})
+
+# Files handed to a worker process per task in batch mode
+PROCESS_CHUNKSIZE = 8
 
 
 def generate_meta_code(file_path, bits):
@@ -35,14 +69,9 @@ def generate_meta_code(file_path, bits):
     if bits is not None:
         kwargs["bits"] = bits
 
-    result = idk.code_meta(fp_str, **kwargs)
+    result = get_sdk().code_meta(fp_str, **kwargs)
 
-    if hasattr(result, "dict"):
-        return result.dict()
-    elif hasattr(result, "model_dump"):
-        return result.model_dump()
-    else:
-        return dict(result)
+    return to_dict(result)
 
 
 def generate_content_code(file_path, bits):
@@ -62,14 +91,9 @@ def generate_content_code(file_path, bits):
     if bits is not None:
         kwargs["bits"] = bits
 
-    result = idk.code_content(fp_str, **kwargs)
+    result = get_sdk().code_content(fp_str, **kwargs)
 
-    if hasattr(result, "dict"):
-        return result.dict()
-    elif hasattr(result, "model_dump"):
-        return result.model_dump()
-    else:
-        return dict(result)
+    return to_dict(result)
 
 
 def generate_data_code(file_path, bits):
@@ -84,19 +108,8 @@ def generate_data_code(file_path, bits):
     Returns:
         Dictionary with data code
     """
-    with open(file_path, "rb") as stream:
-        kwargs = {}
-        if bits is not None:
-            kwargs["bits"] = bits
-
-        result = idk.code_data(stream, **kwargs)
-
-        if hasattr(result, "dict"):
-            return result.dict()
-        elif hasattr(result, "model_dump"):
-            return result.model_dump()
-        else:
-            return dict(result)
+    with open_stream(file_path) as stream:
+        return ic.gen_data_code_v0(stream, bits=bits or ic.core_opts.data_bits)
 
 
 def generate_instance_code(file_path, bits):
@@ -111,19 +124,40 @@ def generate_instance_code(file_path, bits):
     Returns:
         Dictionary with instance code
     """
-    with open(file_path, "rb") as stream:
-        kwargs = {}
-        if bits is not None:
-            kwargs["bits"] = bits
+    with open_stream(file_path) as stream:
+        return ic.gen_instance_code_v0(stream, bits=bits or ic.core_opts.instance_bits)
 
-        result = idk.code_instance(stream, **kwargs)
 
-        if hasattr(result, "dict"):
-            return result.dict()
-        elif hasattr(result, "model_dump"):
-            return result.model_dump()
-        else:
-            return dict(result)
+def generate_data_instance_codes(file_path, bits):
+    # type: (Path, Optional[int]) -> tuple[dict, dict]
+    """
+    Generate Data-Code and Instance-Code in a single pass over the file.
+
+    Each chunk is read once and pushed to both hashers.
+
+    Args:
+        file_path: Path to file
+        bits: Bit length for code
+
+    Returns:
+        Tuple of dictionaries with data code and instance code
+    """
+    data_hasher = ic.DataHasherV0()
+    instance_hasher = ic.InstanceHasherV0()
+    with open_stream(file_path) as stream:
+        chunk = stream.read(ic.core_opts.io_read_size)
+        while chunk:
+            data_hasher.push(chunk)
+            instance_hasher.push(chunk)
+            chunk = stream.read(ic.core_opts.io_read_size)
+
+    data = {"iscc": "ISCC:" + data_hasher.code(bits=bits or ic.core_opts.data_bits)}
+    instance = {
+        "iscc": "ISCC:" + instance_hasher.code(bits=bits or ic.core_opts.instance_bits),
+        "datahash": instance_hasher.multihash(),
+        "filesize": instance_hasher.filesize,
+    }
+    return data, instance
 
 
 def generate_semantic_text(file_path, bits):
@@ -146,14 +180,9 @@ def generate_semantic_text(file_path, bits):
     if bits is not None:
         kwargs["bits"] = bits
 
-    result = idk.code_semantic_text(text, **kwargs)
+    result = get_sdk().code_semantic_text(text, **kwargs)
 
-    if hasattr(result, "dict"):
-        return result.dict()
-    elif hasattr(result, "model_dump"):
-        return result.model_dump()
-    else:
-        return dict(result)
+    return to_dict(result)
 
 
 def generate_semantic_image(file_path, bits):
@@ -173,14 +202,36 @@ def generate_semantic_image(file_path, bits):
     if bits is not None:
         kwargs["bits"] = bits
 
-    result = idk.code_semantic_image(fp_str, **kwargs)
+    result = get_sdk().code_semantic_image(fp_str, **kwargs)
+
+    return to_dict(result)
 
-    if hasattr(result, "dict"):
-        return result.dict()
-    elif hasattr(result, "model_dump"):
-        return result.model_dump()
-    else:
-        return dict(result)
+
+GENERATORS = {
+    "meta": generate_meta_code,
+    "content": generate_content_code,
+    "data": generate_data_code,
+    "instance": generate_instance_code,
+    "semantic-text": generate_semantic_text,
+    "semantic-image": generate_semantic_image,
+}
+
+
+def check_file(file_path):
+    # type: (Path) -> None
+    """
+    Check that a path exists and is a regular file.
+
+    Args:
+        file_path: Path to file
+    """
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Not a file: {file_path}")
 
 
 def generate_unit(file_path, unit_type, bits):
@@ -196,22 +247,9 @@ def generate_unit(file_path, unit_type, bits):
     Returns:
         Dictionary with generated unit
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    if not file_path.is_file():
-        raise ValueError(f"Not a file: {file_path}")
+    check_file(file_path)
 
-    generators = {
-        "meta": generate_meta_code,
-        "content": generate_content_code,
-        "data": generate_data_code,
-        "instance": generate_instance_code,
-        "semantic-text": generate_semantic_text,
-        "semantic-image": generate_semantic_image,
-    }
-
-    generator = generators.get(unit_type)
+    generator = GENERATORS.get(unit_type)
     if not generator:
         raise ValueError(f"Unknown unit type: {unit_type}")
 
@@ -221,21 +259,108 @@ def generate_unit(file_path, unit_type, bits):
         raise RuntimeError(f"Failed to generate {unit_type} code: {e}") from e
 
 
-def format_output(data, pretty):
-    # type: (dict, bool) -> str
+def generate_units(file_path, unit_types, bits):
+    # type: (Path, list[str], Optional[int]) -> dict
     """
-    Format output as JSON.
+    Generate one or more ISCC unit types for a file.
+
+    A single unit type returns the unit itself. Several unit types return a dictionary
+    keyed by unit type, with Data-Code and Instance-Code hashed from one open stream.
 
     Args:
-        data: Data to format
-        pretty: Use human-readable formatting
+        file_path: Path to file
+        unit_types: Types of units to generate
+        bits: Bit length for code
 
     Returns:
-        JSON string
+        Dictionary with generated unit(s)
     """
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    if len(unit_types) == 1:
+        return generate_unit(file_path, unit_types[0], bits)
+
+    units = {}
+    if "data" in unit_types and "instance" in unit_types:
+        check_file(file_path)
+        try:
+            units["data"], units["instance"] = generate_data_instance_codes(file_path, bits)
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate data/instance code: {e}") from e
+
+    for unit_type in unit_types:
+        if unit_type not in units:
+            units[unit_type] = generate_unit(file_path, unit_type, bits)
+    return {unit_type: units[unit_type] for unit_type in unit_types}
+
+
+def parse_unit_types(value):
+    # type: (str) -> list[str]
+    """
+    Parse a comma-separated list of unit types.
+
+    Args:
+        value: Unit types, e.g. "data,instance"
+
+    Returns:
+        List of unique unit types in given order
+    """
+    unit_types = list(dict.fromkeys(v.strip() for v in value.split(",") if v.strip()))
+    unknown = [v for v in unit_types if v not in GENERATORS]
+    if unknown or not unit_types:
+        choices = ", ".join(GENERATORS)
+        raise argparse.ArgumentTypeError(f"invalid unit type: {value!r} (choose from {choices})")
+    return unit_types
+
+
+def generate_one(file_path, unit_types, bits):
+    # type: (Path, list[str], Optional[int]) -> dict
+    """
+    Generate ISCC unit for one file of a batch, capturing errors in the result.
+
+    Args:
+        file_path: Path to file
+        unit_types: Types of units to generate
+        bits: Bit length for code
+
+    Returns:
+        Dictionary with file path and unit fields or error message
+    """
+    try:
+        return {"file": str(file_path), **generate_units(file_path, unit_types, bits)}
+    except Exception as e:
+        return {"file": str(file_path), "error": str(e)}
+
+
+def generate_many(file_paths, unit_types, bits, workers=1):
+    # type: (Iterable[Path], list[str], Optional[int], int) -> Iterator[dict]
+    """
+    Generate ISCC units for multiple files within a single process.
+
+    Models and codecs are initialized once per worker and reused for all its files.
+    I/O-bound units (data, instance) run in worker threads, CPU-bound units such as
+    semantic codes run in worker processes.
+
+    Args:
+        file_paths: Paths to files
+        unit_types: Types of units to generate
+        bits: Bit length for code
+        workers: Number of parallel workers
+
+    Returns:
+        Iterator over result dictionaries in input order (see generate_one)
+    """
+    if workers <= 1:
+        for file_path in file_paths:
+            yield generate_one(file_path, unit_types, bits)
+        return
+
+    task = functools.partial(generate_one, unit_types=unit_types, bits=bits)
+    if THREADED_UNITS.issuperset(unit_types):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(task, file_paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(task, file_paths, chunksize=PROCESS_CHUNKSIZE)
 
 
 def main():
@@ -258,23 +383,28 @@ Examples:
   %(prog)s --unit-type content --bits 128 image.jpg
   %(prog)s --unit-type semantic-text article.txt
   %(prog)s --unit-type instance --pretty video.mp4
+  %(prog)s --unit-type data,instance video.mp4
+  find media -type f | %(prog)s --unit-type data --batch - --workers 4
         """,
     )
 
-    parser.add_argument("file", type=Path, help="File to process")
+    source = parser.add_mutually_exclusive_group(required=True)
+
+    source.add_argument("file", type=Path, nargs="?", help="File to process")
+
+    source.add_argument(
+        "--batch",
+        type=Path,
+        metavar="FILE",
+        help="File with one path per line ('-' for stdin), writes JSON lines",
+    )
 
     parser.add_argument(
         "--unit-type",
         required=True,
-        choices=[
-            "meta",
-            "content",
-            "data",
-            "instance",
-            "semantic-text",
-            "semantic-image",
-        ],
-        help="Type of ISCC unit to generate",
+        type=parse_unit_types,
+        metavar="TYPE[,TYPE...]",
+        help="Type(s) of ISCC unit to generate, comma-separated",
     )
 
     parser.add_argument(
@@ -284,12 +414,34 @@ Examples:
         help="Bit length for ISCC codes (default: 64)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel workers for --batch (default: 1)",
+    )
+
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
 
     args = parser.parse_args()
 
+    if args.batch:
+        if args.pretty:
+            parser.error("--pretty cannot be used with --batch (output is JSON lines)")
+        try:
+            paths = read_paths(args.batch)
+            results = generate_many(paths, args.unit_type, args.bits, args.workers)
+            failed = False
+            for result in results:
+                failed = failed or "error" in result
+                print(format_output(result, args.pretty), flush=True)
+            return 1 if failed else 0
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
     try:
-        result = generate_unit(args.file, args.unit_type, args.bits)
+        result = generate_units(args.file, args.unit_type, args.bits)
         print(format_output(result, args.pretty))
         return 0
 
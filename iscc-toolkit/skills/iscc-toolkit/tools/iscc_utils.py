@@ -8,26 +8,138 @@ ISCC Toolkit Shared Utilities
 Common functions used across multiple ISCC toolkit scripts.
 """
 
+import contextlib
+import functools
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def format_output(data, pretty=False):
-    # type: (dict, bool) -> str
+# Input files larger than this are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1 << 20
+
+
+@functools.lru_cache(maxsize=1)
+def get_sdk():
+    # type: () -> ModuleType
+    """
+    Import iscc-sdk on first use.
+
+    The SDK pulls in media, image and model libraries, so it is only loaded once a
+    file is actually processed and not for --help or argument errors.
+
+    Returns:
+        The iscc_sdk module
+    """
+    import iscc_sdk
+
+    return iscc_sdk
+
+
+def format_output(data, pretty=False, default=None):
+    # type: (dict, bool, Optional[Callable[[Any], Any]]) -> str
     """
     Format output as JSON.
 
+    Uses orjson when installed and falls back to the standard library for data
+    orjson cannot serialize.
+
     Args:
         data: Data to format
         pretty: If True, format with indentation
+        default: Called to convert objects that are not JSON serializable (e.g. str)
 
     Returns:
         JSON string
     """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=default, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
     if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, ensure_ascii=False)
+        return json.dumps(data, indent=2, ensure_ascii=False, default=default)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=default)
+
+
+def load_json(data):
+    # type: (bytes | memoryview) -> dict
+    """
+    Parse JSON from raw bytes without decoding them to a str first.
+
+    Args:
+        data: UTF-8 encoded JSON document (bytes-like, e.g. a memoryview of a mmap)
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If JSON is invalid
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+# Serializer per result class, resolved on first use
+DUMPERS = {}  # type: dict[type, Callable[[Any], dict]]
+
+
+def to_dict(result):
+    # type: (Any) -> dict
+    """
+    Convert an SDK result object to a dictionary.
+
+    The conversion method is looked up once per result class and then reused.
+
+    Args:
+        result: IsccMeta or dict-like result
+
+    Returns:
+        Dictionary representation of the result
+    """
+    cls = type(result)
+    dumper = DUMPERS.get(cls)
+    if dumper is None:
+        dumper = getattr(cls, "dict", None) or getattr(cls, "model_dump", None) or dict
+        DUMPERS[cls] = dumper
+    return dumper(result)
+
+
+@contextlib.contextmanager
+def open_bytes(path):
+    # type: (str | Path) -> Iterator[bytes | memoryview]
+    """
+    Read the raw bytes of a file, memory-mapping files larger than MMAP_THRESHOLD.
+
+    The yielded memoryview of a mapped file is only valid inside the with block.
+
+    Args:
+        path: Path to input file
+
+    Returns:
+        Context manager yielding the file content as bytes or memoryview
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as mv,
+        ):
+            yield mv
 
 
 def read_input(input_path):
@@ -48,19 +160,33 @@ def read_input(input_path):
     if input_path is None or input_path == "-":
         # Read from stdin
         try:
-            data = json.load(sys.stdin)
-            return data
+            return load_json(sys.stdin.buffer.read())
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON from stdin: {e}") from e
     else:
-        # Read from file
-        path = Path(input_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
-
-        with path.open("r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-                return data
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON in file {input_path}: {e}") from e
+        # Read raw bytes from file (no text decoding layer)
+        try:
+            with open_bytes(Path(input_path)) as data:
+                return load_json(data)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {input_path}") from None
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in file {input_path}: {e}") from e
+
+
+def read_paths(source):
+    # type: (Path) -> Iterator[Path]
+    """
+    Read file paths from a batch list, one per line.
+
+    Args:
+        source: Path to list file or "-" for stdin
+
+    Returns:
+        Iterator over non-empty paths
+    """
+    f = sys.stdin if str(source) == "-" else source.open(encoding="utf-8")
+    with f:
+        for line in f:
+            if line.strip():
+                yield Path(line.rstrip("\r\n"))
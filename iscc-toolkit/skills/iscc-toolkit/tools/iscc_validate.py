@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-core>=1.0.0"]
+# dependencies = ["iscc-core>=1.0.0", "jsonschema-rs>=0.20", "orjson>=3.9"]
 # ///
 """Validate ISCC structure and format.
 
@@ -10,6 +10,7 @@ validation for IsccMeta objects.
 """
 
 import argparse
+import functools
 import json
 import sys
 from pathlib import Path
@@ -23,6 +24,74 @@ except ImportError:
     )
     sys.exit(1)
 
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+from iscc_utils import format_output, load_json, open_bytes
+
+# JSON Schema for the core fields of an IsccMeta object, mirroring the constraints of
+# iscc_sdk.IsccMeta.model_json_schema() (optional fields may be null, additional fields allowed)
+ISCC_META_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "IsccMeta",
+    "type": "object",
+    "required": ["iscc"],
+    "properties": {
+        "iscc": {
+            "type": "string",
+            "minLength": 15,
+            "maxLength": 73,
+            "pattern": "^ISCC:[A-Z2-7]{10,73}$",
+        },
+        "name": {"type": ["string", "null"], "minLength": 1, "maxLength": 128},
+        "description": {"type": ["string", "null"], "minLength": 1, "maxLength": 4096},
+        "meta": {"type": ["string", "null"], "maxLength": 16384},
+        "mode": {"enum": ["text", "image", "audio", "video", "mixed", None]},
+        "filename": {"type": ["string", "null"]},
+        "filesize": {"type": ["integer", "null"]},
+        "mediatype": {"type": ["string", "null"]},
+        "metahash": {"type": ["string", "null"], "minLength": 40},
+        "datahash": {"type": ["string", "null"], "minLength": 40},
+        "thumbnail": {"type": ["string", "null"], "format": "uri"},
+        "width": {"type": ["integer", "null"]},
+        "height": {"type": ["integer", "null"], "minimum": 1},
+        "duration": {"type": ["integer", "null"]},
+        "characters": {"type": ["integer", "null"]},
+        "pages": {"type": ["integer", "null"]},
+    },
+}
+
+# Compiled IsccMeta validator (None if jsonschema-rs is not installed)
+ISCC_META_VALIDATOR = (
+    jsonschema_rs.validator_for(ISCC_META_SCHEMA) if jsonschema_rs is not None else None
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def decompose_iscc(iscc_code):
+    # type: (str) -> tuple[str, ...]
+    """
+    Decompose an ISCC into its units (memoized for repeated codes).
+
+    :param iscc_code: ISCC code
+    :return: Tuple of ISCC units
+    """
+    return tuple(ic.iscc_decompose(iscc_code))
+
+
+@functools.lru_cache(maxsize=8192)
+def explain_iscc(iscc_code):
+    # type: (str) -> str
+    """
+    Explain an ISCC code or unit (memoized for repeated codes and units).
+
+    :param iscc_code: ISCC code or unit
+    :return: Human-readable explanation
+    """
+    return ic.iscc_explain(iscc_code)
+
 
 def validate_iscc(iscc_code, strict=False):
     # type: (str, bool) -> dict
@@ -55,10 +124,11 @@ def validate_iscc(iscc_code, strict=False):
             result["details"]["validated_via"] = "decode"
 
         # Try to decompose the ISCC
+        unit_explanations = []
         try:
-            units = ic.iscc_decompose(iscc_code)
+            units = decompose_iscc(iscc_code)
             result["details"]["unit_count"] = len(units)
-            result["details"]["units"] = units
+            result["details"]["units"] = list(units)
 
             # Validate minimum unit requirements
             if len(units) < 2:
@@ -67,10 +137,9 @@ def validate_iscc(iscc_code, strict=False):
                     result["valid"] = False
 
             # Get explanation for each unit
-            unit_explanations = []
             for unit in units:
                 try:
-                    explanation = ic.iscc_explain(unit)
+                    explanation = explain_iscc(unit)
                     unit_explanations.append(explanation)
                 except Exception as e:
                     result["warnings"].append(f"Could not explain unit {unit}: {str(e)}")
@@ -82,9 +151,12 @@ def validate_iscc(iscc_code, strict=False):
             if strict:
                 result["valid"] = False
 
-        # Try to get overall explanation
+        # Try to get overall explanation (a single unit explains itself)
         try:
-            explanation = ic.iscc_explain(iscc_code)
+            if result["details"].get("unit_count") == 1 and unit_explanations:
+                explanation = unit_explanations[0]
+            else:
+                explanation = explain_iscc(iscc_code)
             result["details"]["explanation"] = explanation
         except Exception as e:
             result["warnings"].append(f"Could not explain ISCC: {str(e)}")
@@ -97,11 +169,11 @@ def validate_iscc(iscc_code, strict=False):
 
 
 def validate_metadata_schema(metadata_json, strict=False):
-    # type: (str, bool) -> dict
+    # type: (str | bytes | memoryview, bool) -> dict
     """
     Validate IsccMeta JSON against schema.
 
-    :param metadata_json: JSON string containing IsccMeta object
+    :param metadata_json: JSON document (str or UTF-8 bytes-like) containing IsccMeta object
     :param strict: Enable strict validation mode
     :return: Dictionary containing validation results
     """
@@ -109,16 +181,19 @@ def validate_metadata_schema(metadata_json, strict=False):
 
     try:
         # Parse JSON
-        metadata = json.loads(metadata_json)
+        metadata = load_json(metadata_json)
 
-        # Check for required fields in IsccMeta
-        required_fields = ["iscc"]
-        for field in required_fields:
-            if field not in metadata:
-                result["errors"].append(f"Missing required field: {field}")
+        if ISCC_META_VALIDATOR is not None:
+            # Check against compiled IsccMeta schema
+            for error in ISCC_META_VALIDATOR.iter_errors(metadata):
+                path = "/".join(str(p) for p in error.instance_path)
+                result["errors"].append(f"{path}: {error.message}" if path else error.message)
+        elif "iscc" not in metadata:
+            # Check for required fields in IsccMeta
+            result["errors"].append("Missing required field: iscc")
 
         # If ISCC field exists, validate it
-        if "iscc" in metadata:
+        if isinstance(metadata, dict) and isinstance(metadata.get("iscc"), str):
             iscc_validation = validate_iscc(metadata["iscc"], strict)
             if not iscc_validation["valid"]:
                 result["errors"].extend(iscc_validation["errors"])
@@ -136,57 +211,67 @@ def validate_metadata_schema(metadata_json, strict=False):
     return result
 
 
-def format_pretty(result, is_schema=False):
-    # type: (dict, bool) -> str
+# Static parts of the human-readable report
+SEPARATOR = "=" * 70
+RULE = "-" * 70
+REPORT_HEADER = f"{SEPARATOR}\nISCC Validation Report\n{SEPARATOR}"
+
+
+def iter_pretty(result, is_schema=False):
+    # type: (dict, bool) -> Iterator[str]
     """
-    Format validation results for human-readable output.
+    Yield the lines of a human-readable validation report.
 
     :param result: Validation result dictionary
     :param is_schema: Whether this is a schema validation result
-    :return: Formatted string
+    :return: Iterator over report lines
     """
-    lines = []
-    lines.append("=" * 70)
-    lines.append("ISCC Validation Report")
-    lines.append("=" * 70)
+    yield REPORT_HEADER
 
     if not is_schema:
-        lines.append(f"ISCC Code: {result['iscc_code']}")
-        lines.append("-" * 70)
+        yield f"ISCC Code: {result['iscc_code']}"
+        yield RULE
 
-    status = "VALID" if result["valid"] else "INVALID"
-    symbol = "✓" if result["valid"] else "✗"
-    lines.append(f"Status: {symbol} {status}")
-    lines.append("-" * 70)
+    yield "Status: ✓ VALID" if result["valid"] else "Status: ✗ INVALID"
+    yield RULE
 
     if result.get("errors"):
-        lines.append("Errors:")
-        for error in result["errors"]:
-            lines.append(f"  • {error}")
-        lines.append("-" * 70)
+        yield "Errors:"
+        yield from (f"  • {error}" for error in result["errors"])
+        yield RULE
 
     if result.get("warnings"):
-        lines.append("Warnings:")
-        for warning in result["warnings"]:
-            lines.append(f"  • {warning}")
-        lines.append("-" * 70)
+        yield "Warnings:"
+        yield from (f"  • {warning}" for warning in result["warnings"])
+        yield RULE
 
-    if "details" in result and result["details"]:
-        lines.append("Details:")
-        for key, value in result["details"].items():
-            if key != "unit_details":
-                lines.append(f"  {key}: {value}")
+    details = result.get("details")
+    if details:
+        yield "Details:"
+        yield from (f"  {key}: {value}" for key, value in details.items() if key != "unit_details")
 
-        if "unit_details" in result["details"]:
-            lines.append("\n  Unit Details:")
-            for i, unit_detail in enumerate(result["details"]["unit_details"], 1):
-                lines.append(f"    Unit {i}:")
-                for k, v in unit_detail.items():
-                    lines.append(f"      {k}: {v}")
+        if "unit_details" in details:
+            yield "\n  Unit Details:"
+            for i, unit_detail in enumerate(details["unit_details"], 1):
+                if isinstance(unit_detail, dict):
+                    yield f"    Unit {i}:"
+                    yield from (f"      {k}: {v}" for k, v in unit_detail.items())
+                else:
+                    yield f"    Unit {i}: {unit_detail}"
 
-    lines.append("=" * 70)
+    yield SEPARATOR
+
+
+def format_pretty(result, is_schema=False):
+    # type: (dict, bool) -> str
+    """
+    Format validation results for human-readable output.
 
-    return "\n".join(lines)
+    :param result: Validation result dictionary
+    :param is_schema: Whether this is a schema validation result
+    :return: Formatted string
+    """
+    return "\n".join(iter_pretty(result, is_schema))
 
 
 def main():
@@ -228,9 +313,9 @@ Examples:
             if not json_path.exists():
                 print(f"Error: File not found: {args.input}", file=sys.stderr)
                 sys.exit(1)
-            with open(json_path, encoding="utf-8") as f:
-                metadata_json = f.read()
-            result = validate_metadata_schema(metadata_json, args.strict)
+            # Large files are parsed straight from the mapped pages without a copy
+            with open_bytes(json_path) as data:
+                result = validate_metadata_schema(data, args.strict)
         except Exception as e:
             print(f"Error reading file: {e}", file=sys.stderr)
             sys.exit(1)
@@ -242,7 +327,7 @@ Examples:
     if args.pretty:
         print(format_pretty(result, args.schema))
     else:
-        print(json.dumps(result, indent=2))
+        print(format_output(result, pretty=True))
 
     # Exit with error code if validation failed
     if not result["valid"]:
@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["iscc-crypto>=0.3.0"]
+# dependencies = ["iscc-crypto>=0.3.0", "orjson>=3.9"]
 # ///
 """
 ISCC Note Verifier
@@ -10,7 +10,10 @@ Checks signature validity and optionally verifies identity against controller.
 """
 
 import argparse
+import functools
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from iscc_crypto import verify_iscc_note, verify_json
@@ -19,7 +22,10 @@ except ImportError:
     print("Install it with: pip install iscc-crypto>=0.3.0", file=sys.stderr)
     sys.exit(1)
 
-from iscc_utils import format_output, read_input
+from iscc_utils import format_output, load_json, read_input
+
+# Records handed to each worker process per round trip in --batch mode
+BATCH_CHUNKSIZE = 16
 
 
 def verify_signature(data, use_iscc_note=False):
@@ -69,6 +75,73 @@ def verify_signature(data, use_iscc_note=False):
         }
 
 
+def add_identity(result, data):
+    # type: (dict, dict) -> dict
+    """
+    Copy signer and controller information from the signed data into the result.
+
+    Args:
+        result: Verification result from verify_signature()
+        data: Signed JSON data that was verified
+
+    Returns:
+        The updated verification result
+    """
+    if "signer" not in result and "public_key" in data:
+        result["signer"] = {"public_key": data["public_key"]}
+    if "controller" not in result and "controller" in data:
+        result["controller"] = data["controller"]
+    return result
+
+
+def verify_record(line, use_iscc_note=False):
+    # type: (bytes, bool) -> dict
+    """
+    Parse and verify a single NDJSON record.
+
+    Args:
+        line: One line of NDJSON input
+        use_iscc_note: If True, use verify_iscc_note(); otherwise use verify_json()
+
+    Returns:
+        Verification result, or an error entry if the line is not valid JSON
+    """
+    try:
+        data = load_json(line)
+    except ValueError as e:
+        return {"valid": False, "error": "Input error", "message": str(e)}
+    if not isinstance(data, dict):
+        return {"valid": False, "error": "Input error", "message": "Record is not a JSON object"}
+    return add_identity(verify_signature(data, use_iscc_note), data)
+
+
+def verify_many(lines, use_iscc_note=False, workers=None):
+    # type: (Iterator[bytes], bool, Optional[int]) -> Iterator[dict]
+    """
+    Verify NDJSON records in parallel, yielding results in input order.
+
+    Blank lines are skipped. Each worker process imports iscc-crypto once and
+    verifies records in chunks, so the startup cost is paid per worker, not per record.
+
+    Args:
+        lines: NDJSON lines (bytes)
+        use_iscc_note: If True, use verify_iscc_note(); otherwise use verify_json()
+        workers: Number of worker processes (default: CPU count; 1 verifies serially)
+
+    Yields:
+        Verification result per record
+    """
+    records = (line for line in lines if line.strip())
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for line in records:
+            yield verify_record(line, use_iscc_note)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        verify = functools.partial(verify_record, use_iscc_note=use_iscc_note)
+        yield from executor.map(verify, records, chunksize=BATCH_CHUNKSIZE)
+
+
 def main():
     # type: () -> None
     """Main entry point for the ISCC note verifier."""
@@ -86,10 +159,33 @@ def main():
         action="store_true",
         help="Use verify_iscc_note() instead of verify_json()",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Verify NDJSON records from stdin (one signed document per line), output JSONL",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes for --batch (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
+    if args.batch:
+        if args.pretty:
+            parser.error("--pretty cannot be used with --batch (output is JSON lines)")
+        if args.input:
+            parser.error("--input cannot be used with --batch (records are read from stdin)")
+
     try:
+        if args.batch:
+            all_valid = True
+            for result in verify_many(sys.stdin.buffer, args.iscc_note, args.workers):
+                all_valid = all_valid and result.get("valid", False)
+                print(format_output(result), flush=True)
+            sys.exit(0 if all_valid else 1)
+
         # Read input data
         try:
             data = read_input(args.input)
@@ -102,10 +198,7 @@ def main():
         result = verify_signature(data, use_iscc_note=args.iscc_note)
 
         # Extract signer and controller information if present in the original data
-        if "signer" not in result and "public_key" in data:
-            result["signer"] = {"public_key": data["public_key"]}
-        if "controller" not in result and "controller" in data:
-            result["controller"] = data["controller"]
+        add_identity(result, data)
 
         # Output verification result
         print(format_output(result, args.pretty))
@@ -1,12 +1,16 @@
 """Tests for iscc_compare.py tool."""
 
+import contextlib
+import io
+import json
 import sys
 
+import iscc_core as ic
 import pytest
 
 sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
 
-from iscc_compare import compare_iscc, format_pretty, main
+from iscc_compare import compare_iscc, decompose_units, format_pretty, main, prefix_hamming, run
 
 # Test ISCCs - Content-Code (text)
 ISCC_TEXT_1 = "ISCC:EAASKDNZNYGUUF5A"  # gen_text_code_v0("Hello World")
@@ -24,6 +28,38 @@ ISCC_DATA_2 = "ISCC:GABRJFBIAWJX3FBK"  # gen_data_code_v0(b"different data")
 ISCC_INST_1 = "ISCC:IAA26E2JX66FZKI4"  # gen_instance_code_v0(b"test")
 ISCC_INST_2 = "ISCC:IAAS2OLB4R2TXJSJ"  # gen_instance_code_v0(b"other")
 
+# Test ISCCs - ISCC-CODE composites (meta, text, data, instance units)
+ISCC_CODE_1 = "ISCC:KACSIOC2VIDHWPNSEUG3S3QNJIL2AF5NQE24WG7G4VEHRSQEEXDTT6Q"
+ISCC_CODE_2 = "ISCC:KAAQZ4BEQZMRALNETWVULH7NGV7FISDYZICCLRZZ7I"  # no meta unit
+
+
+@pytest.fixture(scope="module")
+def text_pair_result():
+    # type: () -> dict
+    """Comparison of two different text Content-Codes."""
+    return compare_iscc(ISCC_TEXT_1, ISCC_TEXT_2)
+
+
+@pytest.fixture(scope="module")
+def meta_text_result():
+    # type: () -> dict
+    """Comparison of a Meta-Code with an incompatible text Content-Code."""
+    return compare_iscc(ISCC_META_1, ISCC_TEXT_1)
+
+
+@pytest.fixture(scope="module")
+def inst_same_result():
+    # type: () -> dict
+    """Comparison of an Instance-Code with itself."""
+    return compare_iscc(ISCC_INST_1, ISCC_INST_1)
+
+
+@pytest.fixture(scope="module")
+def inst_diff_result():
+    # type: () -> dict
+    """Comparison of two different Instance-Codes."""
+    return compare_iscc(ISCC_INST_1, ISCC_INST_2)
+
 
 def test_compare_identical_codes():
     # type: () -> None
@@ -39,10 +75,10 @@ def test_compare_identical_codes():
     assert result["types"]["content"]["distance"] == 0
 
 
-def test_compare_different_codes():
-    # type: () -> None
+def test_compare_different_codes(text_pair_result):
+    # type: (dict) -> None
     """Compare different ISCC codes returns score<1.0 and distance>0."""
-    result = compare_iscc(ISCC_TEXT_1, ISCC_TEXT_2)
+    result = text_pair_result
 
     assert "error" not in result
     assert result["iscc_a"] == ISCC_TEXT_1
@@ -76,10 +112,10 @@ def test_compare_data_codes():
     assert "score" in result["types"]["data"]
 
 
-def test_compare_instance_match():
-    # type: () -> None
+def test_compare_instance_match(inst_same_result):
+    # type: (dict) -> None
     """Instance codes with same hash return match=true."""
-    result = compare_iscc(ISCC_INST_1, ISCC_INST_1)
+    result = inst_same_result
 
     assert "error" not in result
     assert "instance" in result["types"]
@@ -87,10 +123,10 @@ def test_compare_instance_match():
     assert result["score"] == 1.0
 
 
-def test_compare_instance_no_match():
-    # type: () -> None
+def test_compare_instance_no_match(inst_diff_result):
+    # type: (dict) -> None
     """Instance codes with different hash return match=false."""
-    result = compare_iscc(ISCC_INST_1, ISCC_INST_2)
+    result = inst_diff_result
 
     assert "error" not in result
     assert "instance" in result["types"]
@@ -98,10 +134,10 @@ def test_compare_instance_no_match():
     assert result["score"] == 0.0
 
 
-def test_compare_no_compatible_units():
-    # type: () -> None
+def test_compare_no_compatible_units(meta_text_result):
+    # type: (dict) -> None
     """Comparing incompatible units returns empty types and null score."""
-    result = compare_iscc(ISCC_META_1, ISCC_TEXT_1)
+    result = meta_text_result
 
     assert "error" not in result
     assert result["types"] == {}
@@ -118,10 +154,61 @@ def test_compare_invalid_iscc():
     assert result["iscc_b"] == ISCC_TEXT_1
 
 
-def test_format_pretty_success():
+def test_prefix_hamming_common_prefix():
+    # type: () -> None
+    """Integer popcount distance covers only the common prefix of both digests."""
+    a = bytes.fromhex("250db96e0d4a17a0ffee0011")
+
+    assert prefix_hamming(a, a) == (0, 96)
+    assert prefix_hamming(a, bytes.fromhex("cf0484659102dda4")) == (26, 64)
+    assert prefix_hamming(a, bytes.fromhex("250db96e0d4a17a1")) == (1, 64)
+
+
+def test_decompose_units_cached():
+    # type: () -> None
+    """Decomposed units are packed header keys, maintypes and digests cached per code."""
+    decompose_units.cache_clear()
+    units = decompose_units(ISCC_TEXT_1)
+    digest = ic.decode_base32(ISCC_TEXT_1[5:])[2:]
+    key = (ic.MT.CONTENT << 16) | (ic.ST_CC.TEXT << 8) | ic.VS.V0
+
+    assert units == ((key, ic.MT.CONTENT, digest),)
+    assert type(units[0][0]) is int
+    assert type(units[0][1]) is int
+    assert decompose_units(ISCC_TEXT_1) is units
+    assert decompose_units.cache_info().hits == 1
+
+
+def test_compare_composite_codes_joins_units():
+    # type: () -> None
+    """Units of composite codes are paired by header and scored like single-unit comparisons."""
+    result = compare_iscc(ISCC_CODE_1, ISCC_CODE_2)
+
+    assert "error" not in result
+    assert list(result["types"]) == ["content", "data", "instance"]
+    for unit in ic.iscc_decompose(ISCC_CODE_2):
+        single = compare_iscc(
+            next(u for u in ic.iscc_decompose(ISCC_CODE_1) if u[:2] == unit[:2]), unit
+        )
+        assert single["types"].items() <= result["types"].items()
+
+
+def test_compare_identical_shortcut_matches_pairwise():
     # type: () -> None
+    """Identical codes skip unit pairing but give the same result as the pairwise path."""
+    for code in (ISCC_CODE_1, ISCC_CODE_2, ISCC_INST_1):
+        result = compare_iscc(code, code)
+        pairwise = compare_iscc(code, code.removeprefix("ISCC:"))
+
+        assert result["score"] == 1.0
+        assert result["types"] == pairwise["types"]
+        assert result["score"] == pairwise["score"]
+
+
+def test_format_pretty_success(text_pair_result):
+    # type: (dict) -> None
     """Format successful comparison result for human readability."""
-    result = compare_iscc(ISCC_TEXT_1, ISCC_TEXT_2)
+    result = text_pair_result
     formatted = format_pretty(result)
 
     assert "ISCC Comparison" in formatted
@@ -131,30 +218,30 @@ def test_format_pretty_success():
     assert "OVERALL" in formatted
 
 
-def test_format_pretty_with_match():
-    # type: () -> None
+def test_format_pretty_with_match(inst_same_result):
+    # type: (dict) -> None
     """Format instance match result correctly."""
-    result = compare_iscc(ISCC_INST_1, ISCC_INST_1)
+    result = inst_same_result
     formatted = format_pretty(result)
 
     assert "instance" in formatted
     assert "match" in formatted
 
 
-def test_format_pretty_no_match():
-    # type: () -> None
+def test_format_pretty_no_match(inst_diff_result):
+    # type: (dict) -> None
     """Format instance no-match result correctly."""
-    result = compare_iscc(ISCC_INST_1, ISCC_INST_2)
+    result = inst_diff_result
     formatted = format_pretty(result)
 
     assert "instance" in formatted
     assert "no match" in formatted
 
 
-def test_format_pretty_no_compatible_units():
-    # type: () -> None
+def test_format_pretty_no_compatible_units(meta_text_result):
+    # type: (dict) -> None
     """Format result with no compatible units."""
-    result = compare_iscc(ISCC_META_1, ISCC_TEXT_1)
+    result = meta_text_result
     formatted = format_pretty(result)
 
     assert "No compatible units to compare" in formatted
@@ -170,44 +257,90 @@ def test_format_pretty_error():
     assert formatted == "ERROR: Test error message"
 
 
-def test_main_json_output(capsys, monkeypatch):
-    # type: (pytest.CaptureFixture, pytest.MonkeyPatch) -> None
-    """Main function outputs JSON by default."""
-    monkeypatch.setattr(sys, "argv", ["iscc_compare.py", ISCC_TEXT_1, ISCC_TEXT_2])
+def test_run_json_output():
+    # type: () -> None
+    """Output is JSON by default."""
+    exit_code, output = run(ISCC_TEXT_1, ISCC_TEXT_2)
+
+    assert exit_code == 0
+    assert '"iscc_a":' in output
+    assert '"iscc_b":' in output
+    assert '"score":' in output
+    assert '"types":' in output
+
+
+def test_run_pretty_output():
+    # type: () -> None
+    """Output is the human-readable report with pretty=True."""
+    exit_code, output = run(ISCC_TEXT_1, ISCC_TEXT_2, pretty=True)
+
+    assert exit_code == 0
+    assert "ISCC Comparison" in output
+    assert "OVERALL" in output
+
 
-    with pytest.raises(SystemExit) as exc_info:
+def test_run_error_exit_code():
+    # type: () -> None
+    """Failed comparisons return exit code 1 with the error in the output."""
+    exit_code, output = run("INVALID", "ALSO_INVALID")
+
+    assert exit_code == 1
+    assert '"error":' in output
+
+
+def test_main_cli(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """The script parses arguments and prints the comparison end-to-end."""
+    monkeypatch.setattr(sys, "argv", ["iscc_compare.py", "--pretty", ISCC_TEXT_1, ISCC_TEXT_2])
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), pytest.raises(SystemExit) as exc_info:
         main()
 
     assert exc_info.value.code == 0
-    captured = capsys.readouterr()
-    assert '"iscc_a":' in captured.out
-    assert '"iscc_b":' in captured.out
-    assert '"score":' in captured.out
-    assert '"types":' in captured.out
+    assert buf.getvalue() == format_pretty(compare_iscc(ISCC_TEXT_1, ISCC_TEXT_2)) + "\n"
 
 
-def test_main_pretty_output(capsys, monkeypatch):
-    # type: (pytest.CaptureFixture, pytest.MonkeyPatch) -> None
-    """Main function outputs pretty format with --pretty flag."""
-    monkeypatch.setattr(sys, "argv", ["iscc_compare.py", "--pretty", ISCC_TEXT_1, ISCC_TEXT_2])
+def test_main_batch_output(monkeypatch, tmp_path):
+    # type: (pytest.MonkeyPatch, Path) -> None
+    """Batch mode writes one JSON line per pair, identical to single comparisons."""
+    file_a = tmp_path / "a.txt"
+    file_b = tmp_path / "b.txt"
+    file_a.write_text(f"{ISCC_TEXT_1}\n{ISCC_META_1}\n", encoding="utf-8")
+    file_b.write_text(f"{ISCC_TEXT_2}\n\n{ISCC_META_2}\n", encoding="utf-8")
+    argv = ["iscc_compare.py", "--batch-a", str(file_a), "--batch-b", str(file_b)]
+    monkeypatch.setattr(sys, "argv", argv)
 
-    with pytest.raises(SystemExit) as exc_info:
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), pytest.raises(SystemExit) as exc_info:
         main()
 
     assert exc_info.value.code == 0
-    captured = capsys.readouterr()
-    assert "ISCC Comparison" in captured.out
-    assert "OVERALL" in captured.out
+    rows = [json.loads(line) for line in buf.getvalue().splitlines()]
+    pairs = [(a, b) for a in (ISCC_TEXT_1, ISCC_META_1) for b in (ISCC_TEXT_2, ISCC_META_2)]
+    assert rows == [compare_iscc(a, b) for a, b in pairs]
+
+
+def test_main_batch_rejects_double_stdin(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """Stdin can only be consumed by one of the two batch lists."""
+    monkeypatch.setattr(sys, "argv", ["iscc_compare.py", "--batch-a", "-", "--batch-b", "-"])
+
+    with contextlib.redirect_stderr(io.StringIO()), pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
 
 
-def test_main_error_exit_code(capsys, monkeypatch):
-    # type: (pytest.CaptureFixture, pytest.MonkeyPatch) -> None
-    """Main function exits with code 1 on error."""
-    monkeypatch.setattr(sys, "argv", ["iscc_compare.py", "INVALID", "ALSO_INVALID"])
+def test_main_batch_rejects_pretty(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """Batch mode writes JSON lines and rejects --pretty."""
+    argv = ["iscc_compare.py", "--batch-a", "a.txt", "--batch-b", "b.txt", "--pretty"]
+    monkeypatch.setattr(sys, "argv", argv)
 
-    with pytest.raises(SystemExit) as exc_info:
+    stderr = io.StringIO()
+    with contextlib.redirect_stderr(stderr), pytest.raises(SystemExit) as exc_info:
         main()
 
-    assert exc_info.value.code == 1
-    captured = capsys.readouterr()
-    assert '"error":' in captured.out
+    assert exc_info.value.code == 2
+    assert "--pretty" in stderr.getvalue()
@@ -0,0 +1,55 @@
+"""Tests for iscc_declare.py tool."""
+
+import asyncio
+import contextlib
+import io
+import sys
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("iscc_crypto")
+
+sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
+
+import iscc_declare  # noqa: E402
+from iscc_declare import declare_many, main  # noqa: E402
+
+ISCC_TEXT_1 = "ISCC:EAASKDNZNYGUUF5A"  # gen_text_code_v0("Hello World")
+ISCC_TEXT_2 = "ISCC:EAAQZ4BEQZMRALNE"  # gen_text_code_v0("Hello World Again")
+
+
+def test_declare_many_keeps_results_on_bad_response(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """A non-JSON response fails only its own declaration."""
+
+    def handler(request):
+        # type: (httpx.Request) -> httpx.Response
+        if ISCC_TEXT_2.encode() in request.content:
+            return httpx.Response(200, text="<html>Bad Gateway</html>")
+        return httpx.Response(201, json={"iscc_id": "ISCC:MAIAAAAAAD2CIAAF"})
+
+    def create_client():
+        # type: () -> httpx.AsyncClient
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(iscc_declare, "create_client", create_client)
+
+    codes = [ISCC_TEXT_1, ISCC_TEXT_2]
+    results = asyncio.run(declare_many(codes, ["1e20ab", "1e20cd"], "https://test/", False))
+
+    assert results[0] == {"iscc_id": "ISCC:MAIAAAAAAD2CIAAF"}
+    assert results[1]["iscc_code"] == ISCC_TEXT_2
+    assert "error" in results[1]
+
+
+@pytest.mark.parametrize("option", [["--pretty"], [ISCC_TEXT_1], ["--datahash", "1e20ab"]])
+def test_main_stdin_rejects_options(monkeypatch, option):
+    # type: (pytest.MonkeyPatch, list[str]) -> None
+    """Stdin mode writes JSON lines and rejects single-declaration options."""
+    monkeypatch.setattr(sys, "argv", ["iscc_declare.py", "--stdin", *option])
+
+    with contextlib.redirect_stderr(io.StringIO()), pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
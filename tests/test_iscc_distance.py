@@ -0,0 +1,183 @@
+"""Tests for iscc_distance.py tool."""
+
+import sys
+
+import iscc_core as ic
+import numpy as np
+
+sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
+
+import iscc_distance
+from iscc_distance import (
+    batch_compare,
+    calculate_distance,
+    decode_base32_batch,
+    decode_iscc_bytes,
+    hamming_rows,
+)
+
+# Test ISCCs - Content-Code (text)
+ISCC_TEXT_1 = "ISCC:EAASKDNZNYGUUF5A"  # gen_text_code_v0("Hello World")
+ISCC_TEXT_2 = "ISCC:EAAQZ4BEQZMRALNE"  # gen_text_code_v0("Hello World Again")
+ISCC_TEXT_128 = "ISCC:EABSKDNZNYGUUF5AMFEJLZ5P66CP4"  # gen_text_code_v0("Hello World", bits=128)
+
+# Test ISCCs - Meta-Code
+ISCC_META_1 = "ISCC:AAASIOC2VIDHWPNS"  # gen_meta_code_v0("Test Title")
+
+# Test ISCCs - ISCC-IDv1
+ISCC_ID_1 = "ISCC:MAIAAAAAAD2CIAAF"  # gen_iscc_id_v1(timestamp=1000000, hub_id=5)
+ISCC_ID_2 = "ISCC:MAIAAAAAAD2CIEAF"  # gen_iscc_id_v1(timestamp=1000001, hub_id=5)
+
+
+def test_calculate_distance_identical():
+    # type: () -> None
+    """Identical codes have zero distance."""
+    result = calculate_distance(ISCC_TEXT_1, ISCC_TEXT_1)
+
+    assert "error" not in result
+    assert result["hamming_distance"] == 0
+    assert result["similarity_percentage"] == 100.0
+
+
+def test_calculate_distance_incompatible():
+    # type: () -> None
+    """Codes of different types return an error."""
+    result = calculate_distance(ISCC_TEXT_1, ISCC_META_1)
+
+    assert "error" in result
+
+
+def test_batch_compare_matches_single(tmp_path):
+    # type: (Path) -> None
+    """Batch distances are identical to pairwise distances."""
+    candidate_file = tmp_path / "candidates.txt"
+    candidate_file.write_text(f"{ISCC_TEXT_2}\n\n{ISCC_TEXT_1}\n", encoding="utf-8")
+
+    result = batch_compare(ISCC_TEXT_1, candidate_file, threshold=80)
+
+    assert "error" not in result
+    assert result["total_candidates"] == 2
+    assert result["best_match"]["iscc_b"] == ISCC_TEXT_1
+    assert result["matches_above_threshold"] == 1
+    for comp in result["comparisons"]:
+        assert comp == calculate_distance(ISCC_TEXT_1, comp["iscc_b"], 80)
+
+
+def test_batch_compare_mismatched_candidates(tmp_path):
+    # type: (Path) -> None
+    """Candidates with different type, length or invalid encoding get error entries."""
+    candidate_file = tmp_path / "candidates.txt"
+    lines = [ISCC_META_1, ISCC_TEXT_128, "INVALID!", "EAASKDNZNYGUUF5!", ISCC_TEXT_2]
+    candidate_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    result = batch_compare(ISCC_TEXT_1, candidate_file)
+
+    assert result["total_candidates"] == 5
+    errors = [c for c in result["comparisons"] if "error" in c]
+    assert len(errors) == 4
+    assert result["best_match"]["iscc_b"] == ISCC_TEXT_2
+
+
+def test_batch_compare_rejects_iscc_id_v1(tmp_path):
+    # type: (Path) -> None
+    """ISCC-IDv1 references and candidates are rejected like in pairwise comparison."""
+    candidate_file = tmp_path / "candidates.txt"
+    candidate_file.write_text(f"{ISCC_ID_2}\n", encoding="utf-8")
+
+    error = calculate_distance(ISCC_ID_1, ISCC_ID_2)["error"]
+    assert batch_compare(ISCC_ID_1, candidate_file)["error"] == error
+
+    result = batch_compare(ISCC_TEXT_1, candidate_file)
+    assert result["comparisons"][0]["error"] == error
+
+
+def test_hamming_rows_lookup_fallback(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """Word-wise popcount and byte lookup table produce identical distances."""
+    rng = np.random.default_rng(0)
+    cand = rng.integers(0, 256, size=(50, 32), dtype=np.uint8)
+    ref = rng.integers(0, 256, size=32, dtype=np.uint8)
+
+    fast = hamming_rows(cand, ref)
+    monkeypatch.setattr(iscc_distance, "HAS_BITWISE_COUNT", False)
+    slow = hamming_rows(cand, ref)
+
+    assert fast.tolist() == slow.tolist()
+    assert fast[0] == sum(bin(a ^ b).count("1") for a, b in zip(cand[0], ref, strict=True))
+
+
+def test_batch_compare_streamed_lines(tmp_path):
+    # type: (Path) -> None
+    """Candidate files with CRLF endings, dashes or no trailing newline are parsed."""
+    candidate_file = tmp_path / "candidates.txt"
+    candidate_file.write_bytes(b"  iscc:EAAQZ4BEQZMRALNE\r\n\r\nEAASKDNZ-NYGUUF5A")
+
+    result = batch_compare(ISCC_TEXT_1, candidate_file)
+
+    assert result["total_candidates"] == 2
+    assert all("error" not in c for c in result["comparisons"])
+    assert result["best_match"]["hamming_distance"] == 0
+
+
+def test_batch_compare_empty_file(tmp_path):
+    # type: (Path) -> None
+    """An empty candidate file yields no comparisons."""
+    candidate_file = tmp_path / "candidates.txt"
+    candidate_file.write_bytes(b"")
+
+    result = batch_compare(ISCC_TEXT_1, candidate_file)
+
+    assert result["total_candidates"] == 0
+    assert result["best_match"] is None
+
+
+def test_decode_base32_batch_matches_stdlib():
+    # type: () -> None
+    """Vectorized base32 decoding matches per-code decoding and flags invalid symbols."""
+    codes = [b"EAASKDNZNYGUUF5A", b"eaaqz4beqzmralne", b"EAASKDNZNYGUUF5!"]
+
+    decoded, valid = decode_base32_batch(codes, 10)
+
+    assert valid.tolist() == [True, True, False]
+    for row, code in zip(decoded[:2], codes[:2], strict=True):
+        assert row.tobytes() == decode_iscc_bytes(code)
+
+
+def test_calculate_distance_matches_iscc_core():
+    # type: () -> None
+    """Integer popcount distance matches iscc-core."""
+    result = calculate_distance(ISCC_TEXT_1, ISCC_TEXT_2)
+
+    assert result["hamming_distance"] == ic.iscc_distance(ISCC_TEXT_1, ISCC_TEXT_2)
+
+
+def test_batch_compare_ranking_and_top(tmp_path):
+    # type: (Path) -> None
+    """Candidates are ranked like a stable similarity sort and --top keeps the best K."""
+    codes = [ic.gen_text_code_v0(f"Hello World {i % 7}")["iscc"] for i in range(30)]
+    candidate_file = tmp_path / "candidates.txt"
+    candidate_file.write_text("\n".join(codes + ["INVALID!"]), encoding="utf-8")
+    expected = [calculate_distance(ISCC_TEXT_1, code, 50) for code in codes]
+    expected.sort(key=lambda x: x["similarity_percentage"], reverse=True)
+
+    full = batch_compare(ISCC_TEXT_1, candidate_file, threshold=50)
+    top = batch_compare(ISCC_TEXT_1, candidate_file, threshold=50, top=5)
+
+    assert full["comparisons"][:-1] == expected
+    assert "error" in full["comparisons"][-1]
+    assert full["matches_above_threshold"] == sum(c["meets_threshold"] for c in expected)
+    assert [c["similarity_percentage"] for c in top["comparisons"]] == [
+        c["similarity_percentage"] for c in expected[:5]
+    ]
+    assert top["best_match"] == expected[0]
+
+
+def test_calculate_distance_total_bits():
+    # type: () -> None
+    """Similarity is relative to the compared digest bits, not the code string length."""
+    result = calculate_distance(ISCC_TEXT_1, ISCC_TEXT_2)
+
+    assert result["total_bits"] == 64
+    assert result["matching_bits"] == 64 - result["hamming_distance"]
+    assert result["similarity_percentage"] == round(result["matching_bits"] / 64 * 100, 2)
+    assert calculate_distance(ISCC_TEXT_128, ISCC_TEXT_128)["total_bits"] == 128
@@ -0,0 +1,60 @@
+"""Tests for iscc_inspect.py tool."""
+
+import sys
+
+import iscc_core as ic
+
+sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
+
+from iscc_inspect import decompose_and_explain, format_binary, inspect_iscc
+
+# Test ISCC-CODE with Meta, Content, Data and Instance units
+ISCC_CODE = "ISCC:KACYPXW445FTYNJ3CYSXHAFJMA2HUWULUNRFE3BLHRSCXYH2M5AEGQY"
+
+# Test ISCC-CODE of SUM subtype (Data + Instance only)
+ISCC_SUM = "ISCC:KUAFVC5DMJJGYKZ4MQV6B6THIBBUG"
+
+# Concatenated Meta-Code and text Content-Code units (not a valid ISCC-CODE)
+ISCC_UNIT_SEQUENCE = "ISCC:AAASIOC2VIDHWPNSEAASKDNZNYGUUF5A"
+
+
+def test_format_binary_matches_bin():
+    # type: () -> None
+    """Binary formatting is identical to bin() including leading zero handling."""
+    for data in [b"", b"\x00\x00", b"\x00\x01\xff", bytes(range(32))]:
+        assert format_binary(data) == bin(int.from_bytes(data, byteorder="big"))
+
+
+def test_inspect_iscc_units():
+    # type: () -> None
+    """Inspection decomposes all units and includes requested representations."""
+    result = inspect_iscc(ISCC_CODE, show_binary=True, show_hex=True)
+
+    assert "error" not in result
+    assert result["unit_count"] == 4
+    meta = result["units"][0]
+    assert meta["iscc"] == "AAAYPXW445FTYNJ3"
+    assert meta["hex"] == "000187dedce74b3c353b"
+    assert meta["binary"] == bin(int(meta["hex"], 16))
+
+
+def test_decompose_and_explain_matches_iscc_core():
+    # type: () -> None
+    """Single-pass decomposition matches iscc_decompose and iscc_explain."""
+    for code in [ISCC_CODE, ISCC_SUM, "ISCC:EABSKDNZNYGUUF5AMFEJLZ5P66CP4"]:
+        explanation, units = decompose_and_explain(code)
+        expected = ic.iscc_decompose(code)
+
+        assert explanation == ic.iscc_explain(code)
+        assert [u[0] for u in units] == expected
+        assert [u[1] for u in units] == [ic.iscc_explain(u) for u in expected]
+        assert [u[2] for u in units] == [ic.decode_base32(u) for u in expected]
+
+
+def test_inspect_iscc_unit_sequence():
+    # type: () -> None
+    """A unit sequence is rejected like by iscc-core instead of explained as one unit."""
+    result = inspect_iscc(ISCC_UNIT_SEQUENCE)
+
+    assert "error" in result
+    assert "explanation" not in result
@@ -0,0 +1,26 @@
+"""Tests for iscc_metadata_embed.py tool."""
+
+import sys
+
+import pytest
+
+pytest.importorskip("iscc_sdk")
+
+sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
+
+from iscc_metadata_embed import embed_many  # noqa: E402
+
+
+def test_embed_many_bad_metadata_path(tmp_path):
+    # type: (Path) -> None
+    """An unreadable metadata path fails its own job instead of the whole batch."""
+    media = tmp_path / "a.jpg"
+    media.write_bytes(b"")
+    metadata_dir = tmp_path / "metadir"
+    metadata_dir.mkdir()
+
+    results = list(embed_many([(media, str(metadata_dir), None)], workers=1))
+
+    assert len(results) == 1
+    assert results[0]["status"] == "error"
+    assert results[0]["input_file"] == str(media)
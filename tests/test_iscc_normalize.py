@@ -0,0 +1,114 @@
+"""Tests for iscc_normalize.py tool."""
+
+import sys
+
+import iscc_core as ic
+
+sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
+
+import iscc_normalize
+from iscc_normalize import (
+    char_stats,
+    collapse_text,
+    ngram_hashes,
+    ngram_offsets,
+    ngram_windows,
+    normalize_cached,
+    normalize_text,
+)
+
+SAMPLE_TEXT = "Héllo,  Wörld!\tÜber café №42 — ½  日本語 ﬁ\n"
+
+
+def test_char_stats_matches_str_methods():
+    # type: () -> None
+    """Vectorized statistics match per-character str predicates."""
+    stats = char_stats(SAMPLE_TEXT)
+
+    assert stats["characters"] == len(SAMPLE_TEXT)
+    assert stats["bytes"] == len(SAMPLE_TEXT.encode("utf-8"))
+    assert stats["unique_chars"] == len(set(SAMPLE_TEXT))
+    assert stats["whitespace_count"] == sum(1 for c in SAMPLE_TEXT if c.isspace())
+    assert stats["alphanumeric_count"] == sum(1 for c in SAMPLE_TEXT if c.isalnum())
+    assert stats["punctuation_count"] == sum(
+        1 for c in SAMPLE_TEXT if not c.isalnum() and not c.isspace()
+    )
+
+
+def test_char_stats_empty():
+    # type: () -> None
+    """Empty text yields zero counts."""
+    assert set(char_stats("").values()) == {0}
+
+
+def test_normalize_text_collapse_stats():
+    # type: () -> None
+    """Collapse mode reports statistics for original and normalized text."""
+    result = normalize_text(SAMPLE_TEXT, collapse=True, show_stats=True)
+
+    assert "error" not in result
+    assert result["statistics"]["original"] == char_stats(SAMPLE_TEXT)
+    assert result["statistics"]["normalized"]["whitespace_count"] == 0
+
+
+def test_collapse_text_ascii_fast_path():
+    # type: () -> None
+    """ASCII fast path produces the same result as iscc-core."""
+    ascii_text = "".join(chr(i) for i in range(128)) + " The Quick-Brown FOX, jumps! $5 + 3 <= 9"
+    for text in [ascii_text, SAMPLE_TEXT, ""]:
+        assert collapse_text(text) == ic.text_collapse(text)
+
+
+def test_normalize_cached_reuses_result(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """Repeated inputs are served from the cache without normalizing again."""
+    first = normalize_cached("Cached Text Sample", True)
+    monkeypatch.setattr(iscc_normalize, "collapse_text", lambda text: "recomputed")
+
+    assert normalize_cached("Cached Text Sample", True) == first
+    assert normalize_cached("Another Text Sample", True) == "recomputed"
+
+
+def test_ngram_offsets_and_windows():
+    # type: () -> None
+    """Offsets and codepoint windows reconstruct the same n-grams as string slicing."""
+    text = "Hello 日本語 world"
+    expected = list(iscc_normalize.iter_ngrams(text, 5))
+
+    offsets = ngram_offsets(text, 5)
+    windows = ngram_windows(text, 5)
+
+    assert [text[i : i + 5] for i in offsets.tolist()] == expected
+    assert ["".join(map(chr, row)) for row in windows.tolist()] == expected
+    assert ngram_offsets("abc", 5).size == 0
+    assert ngram_windows("abc", 5).shape == (0, 5)
+
+
+def test_char_stats_ascii_histogram():
+    # type: () -> None
+    """ASCII histogram path matches the general codepoint path."""
+    text = "Hello,  World!\tfoo_bar 42\n"
+
+    assert char_stats(text) == {
+        "characters": len(text),
+        "bytes": len(text),
+        "unique_chars": len(set(text)),
+        "whitespace_count": sum(1 for c in text if c.isspace()),
+        "alphanumeric_count": sum(1 for c in text if c.isalnum()),
+        "punctuation_count": sum(1 for c in text if not c.isalnum() and not c.isspace()),
+    }
+
+
+def test_ngram_hashes_match_polynomial():
+    # type: () -> None
+    """Vectorized n-gram hashes equal the polynomial hash of each n-gram modulo 2**64."""
+    text = "Hello 日本語 world"
+    base = int(iscc_normalize.NGRAM_HASH_BASE)
+
+    expected = [
+        sum(ord(c) * pow(base, 4 - k, 2**64) for k, c in enumerate(ngram)) % 2**64
+        for ngram in iscc_normalize.iter_ngrams(text, 5)
+    ]
+
+    assert ngram_hashes(text, 5).tolist() == expected
+    assert ngram_hashes("abc", 5).size == 0
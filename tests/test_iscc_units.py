@@ -0,0 +1,38 @@
+"""Tests for iscc_units.py tool."""
+
+import io
+import sys
+
+import iscc_core as ic
+
+sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
+
+from iscc_units import generate_data_code, generate_instance_code, generate_units
+from iscc_utils import MMAP_THRESHOLD
+
+
+def test_data_instance_codes_small_and_large(tmp_path):
+    # type: (Path) -> None
+    """Buffered and memory-mapped files give the same codes as in-memory streams."""
+    for size in (1000, MMAP_THRESHOLD + 12345):
+        data = (bytes(range(251)) * (size // 251 + 1))[:size]
+        file_path = tmp_path / f"file_{size}.bin"
+        file_path.write_bytes(data)
+
+        assert generate_data_code(file_path, None) == ic.gen_data_code_v0(io.BytesIO(data))
+        assert generate_instance_code(file_path, 128) == ic.gen_instance_code_v0(
+            io.BytesIO(data), bits=128
+        )
+
+
+def test_generate_units_data_instance_large_file(tmp_path):
+    # type: (Path) -> None
+    """Combined data/instance pass over a memory-mapped file matches separate units."""
+    file_path = tmp_path / "large.bin"
+    file_path.write_bytes(bytes(range(256)) * (MMAP_THRESHOLD // 128) + b"tail")
+
+    result = generate_units(file_path, ["instance", "data"], 64)
+
+    assert list(result) == ["instance", "data"]
+    assert result["data"] == generate_data_code(file_path, 64)
+    assert result["instance"] == generate_instance_code(file_path, 64)
@@ -0,0 +1,108 @@
+"""Tests for iscc_validate.py tool."""
+
+import io
+import json
+import sys
+
+import iscc_core as ic
+import pytest
+
+sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
+
+import iscc_validate
+from iscc_validate import format_pretty, validate_iscc, validate_metadata_schema
+
+ISCC_TEXT_1 = "ISCC:EAASKDNZNYGUUF5A"  # gen_text_code_v0("Hello World")
+
+
+def test_validate_metadata_schema_valid():
+    # type: () -> None
+    """Metadata with a valid ISCC passes schema validation."""
+    result = validate_metadata_schema(json.dumps({"iscc": ISCC_TEXT_1, "name": "Hello"}))
+
+    assert result["valid"]
+    assert result["errors"] == []
+    assert result["iscc_validation"]["valid"]
+
+
+def test_validate_metadata_schema_missing_iscc():
+    # type: () -> None
+    """Metadata without an ISCC field is rejected."""
+    result = validate_metadata_schema(json.dumps({"name": "Hello"}))
+
+    assert not result["valid"]
+    assert len(result["errors"]) == 1
+    assert "iscc" in result["errors"][0]
+
+
+def test_validate_metadata_schema_matches_iscc_meta():
+    # type: () -> None
+    """Null optional fields and multibase hashes are accepted like the official IsccMeta."""
+    pytest.importorskip("jsonschema_rs")
+    metadata = {
+        "iscc": ISCC_TEXT_1,
+        "name": None,
+        "mode": None,
+        "filesize": None,
+        "datahash": "z" + "1" * 47,
+        "metahash": "1e20" + "ab" * 32,
+    }
+
+    result = validate_metadata_schema(json.dumps(metadata))
+    assert result["valid"], result["errors"]
+
+    result = validate_metadata_schema(json.dumps({"iscc": ISCC_TEXT_1, "datahash": "abc"}))
+    assert not result["valid"]
+    assert result["errors"][0].startswith("datahash: ")
+
+
+def test_validate_metadata_schema_fallback(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """Without jsonschema-rs only the required ISCC field is checked."""
+    monkeypatch.setattr(iscc_validate, "ISCC_META_VALIDATOR", None)
+
+    assert validate_metadata_schema(json.dumps({"iscc": ISCC_TEXT_1, "filesize": -1}))["valid"]
+    result = validate_metadata_schema(json.dumps({"name": "Hello"}))
+    assert result["errors"] == ["Missing required field: iscc"]
+
+
+def test_validate_iscc_cached_matches_iscc_core():
+    # type: () -> None
+    """Memoized decomposition and explanations match iscc-core across repeated calls."""
+    iscc_code = ic.gen_iscc_code_v0(
+        [
+            ic.gen_data_code_v0(io.BytesIO(b"data"))["iscc"],
+            ic.gen_instance_code_v0(io.BytesIO(b"data"))["iscc"],
+        ]
+    )["iscc"]
+
+    first = validate_iscc(iscc_code)
+    second = validate_iscc(iscc_code)
+
+    assert first == second
+    assert first["details"]["units"] == ic.iscc_decompose(iscc_code)
+    assert first["details"]["unit_details"] == [
+        ic.iscc_explain(u) for u in ic.iscc_decompose(iscc_code)
+    ]
+    assert first["details"]["explanation"] == ic.iscc_explain(iscc_code)
+
+
+def test_format_pretty_unit_details():
+    # type: () -> None
+    """Pretty report lists errors and one line per unit explanation."""
+    report = format_pretty(validate_iscc(ISCC_TEXT_1))
+
+    assert report.startswith("=" * 70 + "\nISCC Validation Report\n")
+    assert "Status: ✓ VALID" in report
+    assert "  • ISCC-CODE must contain at least 2 units (DATA + INSTANCE)" in report
+    assert "    Unit 1: CONTENT-TEXT-V0-64-250db96e0d4a17a0" in report
+    assert report.endswith("=" * 70)
+
+
+def test_validate_iscc_single_unit_explanation():
+    # type: () -> None
+    """A single-unit code reuses its unit explanation as overall explanation."""
+    details = validate_iscc(ISCC_TEXT_1)["details"]
+
+    assert details["explanation"] == ic.iscc_explain(ISCC_TEXT_1)
+    assert details["unit_details"] == [details["explanation"]]
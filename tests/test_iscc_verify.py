@@ -0,0 +1,65 @@
+"""Tests for iscc_verify.py tool."""
+
+import contextlib
+import io
+import json
+import sys
+
+import pytest
+
+iscc_crypto = pytest.importorskip("iscc_crypto")
+if not hasattr(iscc_crypto, "verify_iscc_note"):
+    pytest.skip("iscc-crypto without ISCC note support", allow_module_level=True)
+
+sys.path.insert(0, "iscc-toolkit/skills/iscc-toolkit/tools")
+
+from iscc_verify import main, verify_many, verify_record  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def signed_record():
+    # type: () -> bytes
+    """NDJSON line with a document signed by a fresh keypair."""
+    keypair = iscc_crypto.key_generate()
+    return json.dumps(iscc_crypto.sign_json({"name": "Test"}, keypair)).encode()
+
+
+def test_verify_record_valid(signed_record):
+    # type: (bytes) -> None
+    """A correctly signed record verifies."""
+    assert verify_record(signed_record)["valid"]
+
+
+def test_verify_many_mixed_records(signed_record):
+    # type: (bytes) -> None
+    """Invalid and non-object records get error results in input order."""
+    tampered = signed_record.replace(b'"Test"', b'"Changed"')
+    lines = [signed_record, b"\n", tampered, b"[1, 2]", b"{not json"]
+
+    results = list(verify_many(iter(lines), workers=1))
+
+    assert len(results) == 4
+    assert results[0]["valid"]
+    assert not results[1]["valid"]
+    assert results[1]["error"]
+    assert results[2] == {
+        "valid": False,
+        "error": "Input error",
+        "message": "Record is not a JSON object",
+    }
+    assert not results[3]["valid"]
+    assert results[3]["error"] == "Input error"
+
+
+@pytest.mark.parametrize("option", [["--pretty"], ["--input", "signed.json"]])
+def test_main_batch_rejects_options(monkeypatch, option):
+    # type: (pytest.MonkeyPatch, list[str]) -> None
+    """Batch mode reads NDJSON from stdin, writes JSON lines and rejects conflicting options."""
+    monkeypatch.setattr(sys, "argv", ["iscc_verify.py", "--batch", *option])
+
+    stderr = io.StringIO()
+    with contextlib.redirect_stderr(stderr), pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert option[0] in stderr.getvalue()